@@ -0,0 +1,165 @@
+"""
+Negotiated compression of API responses.
+
+gzip is always available; brotli and zstd are offered when the ``brotli``
+and ``zstandard`` packages are installed.  Payloads that never change (the
+demo model and result, and a solve result under its ETag) are encoded and
+compressed once per process, served from those bytes afterwards, and carry
+strong ETags so clients can revalidate them.
+"""
+import gzip
+import hashlib
+import re
+import zlib
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+from cooling.thermal.cache import LRUCache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Responses shorter than this are sent as they are.
+MIN_SIZE = 1024
+
+CODECS = {'gzip': lambda data: gzip.compress(data, compresslevel=6, mtime=0)}
+if brotli is not None:
+    CODECS['br'] = lambda data: brotli.compress(data, quality=5)
+if zstandard is not None:
+    CODECS['zstd'] = lambda data: zstandard.ZstdCompressor(level=6).compress(data)
+
+# Preferred first when the client accepts several with the same weight.
+PREFERENCE = ('br', 'zstd', 'gzip')
+
+ACCEPT_ENCODING = re.compile(r'\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?\s*')
+
+# (payload key, coding) -> encoded and possibly compressed body and its
+# ETag, bounded by the bytes of the bodies
+PRECOMPRESSED = LRUCache(maxsize=64 * 1024 * 1024)
+
+
+def negotiate(accept_encoding, codings=PREFERENCE):
+    """
+    The coding out of ``codings`` to use for an ``Accept-Encoding`` header,
+    or None.
+    """
+    weights = {}
+    for token in (accept_encoding or '').split(','):
+        match = ACCEPT_ENCODING.fullmatch(token)
+        if not match:
+            continue
+        try:
+            weights[match.group(1).lower()] = float(match.group(2) or 1.0)
+        except ValueError:
+            continue
+    best, best_weight = None, 0.0
+    for coding in codings:
+        if coding not in CODECS:
+            continue
+        weight = weights.get(coding, weights.get('*', 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def _gzip_stream(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def coded_etag(etag, coding):
+    """
+    The strong ETag of the ``coding`` compressed variant of ``etag``.
+    """
+    return '%s-%s"' % (etag[:-1], coding)
+
+
+def precompressed_response(request, key, encode, last_modified=None, content_type='application/json', etag=None):
+    """
+    Response for an immutable payload: ``encode()`` runs once per ``key``
+    and the body is compressed once per coding.  The body is tagged with
+    ``etag``, or the hash of the body without one, and each coding gets its
+    own strong ETag.  A matching If-None-Match (or If-Modified-Since against
+    ``last_modified``, a timestamp) is answered with 304 Not Modified.
+    """
+    coding = negotiate(request.META.get('HTTP_ACCEPT_ENCODING'))
+    entry = PRECOMPRESSED.get((key, None))
+    if entry is None:
+        body = encode()
+        entry = (body, etag or '"%s"' % hashlib.sha1(body).hexdigest())
+        PRECOMPRESSED.put((key, None), entry, size=len(body))
+    if coding is not None and len(entry[0]) >= MIN_SIZE:
+        compressed = PRECOMPRESSED.get((key, coding))
+        if compressed is None:
+            compressed = (CODECS[coding](entry[0]), coded_etag(entry[1], coding))
+            PRECOMPRESSED.put((key, coding), compressed, size=len(compressed[0]))
+        entry = compressed
+    else:
+        coding = None
+    body, etag = entry
+
+    if last_modified is not None:
+        # HTTP dates have whole seconds
+        last_modified = int(last_modified)
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    response = not_modified if not_modified is not None else HttpResponse(body, content_type=content_type)
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    if coding is not None and not_modified is None:
+        response['Content-Encoding'] = coding
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
+class CompressionMiddleware(object):
+    """
+    Compress responses with the best coding the client accepts, like
+    Django's GZipMiddleware but with brotli and zstd when available.
+    Streaming responses are gzipped on the fly.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if response.has_header('Content-Encoding'):
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        coding = negotiate(request.META.get('HTTP_ACCEPT_ENCODING'),
+                           ('gzip',) if response.streaming else PREFERENCE)
+        if coding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = _gzip_stream(response.streaming_content)
+            del response['Content-Length']
+        else:
+            if len(response.content) < MIN_SIZE:
+                return response
+            compressed = CODECS[coding](response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            # the compressed body is a different representation
+            response['ETag'] = 'W/' + etag
+        response['Content-Encoding'] = coding
+        return response
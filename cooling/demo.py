@@ -0,0 +1,71 @@
+"""
+The demo model and its reference solve result.
+
+The parsed demo model is kept per process and reloaded when the file's
+modification time changes.
+
+The winding temperatures are stored as a packed array (int16 grid, axial,
+radial and tangential indices, float64 axial coordinate and temperature) and
+memory-mapped read-only, so every worker shares the same pages instead of
+importing a Python literal; the few component values sit in a JSON sidecar.
+"""
+import functools
+import json
+import os
+import threading
+
+import numpy as np
+
+from backend.settings import BASE_DIR
+
+DEMO_MODEL = os.path.join(BASE_DIR, 'model.json')
+DEMO_RESULT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'demo_result')
+
+_demo_model = {}
+_demo_model_lock = threading.Lock()
+
+
+def demo_model():
+    """
+    ``(model, mtime)`` of the demo model file, parsed once per version.
+    """
+    mtime = os.stat(DEMO_MODEL).st_mtime
+    with _demo_model_lock:
+        if _demo_model.get('mtime') != mtime:
+            with open(DEMO_MODEL) as json_data:
+                _demo_model.update(model=json.load(json_data), mtime=mtime)
+        return _demo_model['model'], _demo_model['mtime']
+
+
+def demo_result_mtime():
+    return os.stat(DEMO_RESULT + '.npy').st_mtime
+
+
+@functools.lru_cache(maxsize=1)
+def _load():
+    with open(DEMO_RESULT + '.json') as f:
+        meta = json.load(f)
+    return meta, np.load(DEMO_RESULT + '.npy', mmap_mode='r')
+
+
+def demo_result():
+    """
+    The reference result in the shape of a ``cooling/solve`` response.
+    """
+    meta, windings = _load()
+    winding_temperatures = []
+    for index, grid in enumerate(meta['grids']):
+        rows = windings[windings['grid'] == index]
+        winding_temperatures.append([{
+            'AxialCoordinate': coordinate,
+            'Name': '%s_%d_%d_%d' % (grid, a, r, t),
+            'RadialLocation': r,
+            'TangentialLocation': t,
+            'Temperature': temperature,
+        } for a, r, t, coordinate, temperature in zip(
+            rows['axial'].tolist(), rows['radial'].tolist(), rows['tangential'].tolist(),
+            rows['axial_coordinate'].tolist(), rows['temperature'].tolist())])
+    return {
+        'component_temperatures': meta['component_temperatures'],
+        'winding_temperatures': winding_temperatures,
+    }
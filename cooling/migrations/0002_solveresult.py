@@ -0,0 +1,33 @@
+# Generated by Django 3.1.6 on 2026-10-18 10:34
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('cooling', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SolveResult',
+            fields=[
+                ('key', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('result', models.BinaryField()),
+                ('size', models.IntegerField()),
+                ('used', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'db_table': 'cooling_solve_result',
+            },
+        ),
+        migrations.AlterField(
+            model_name='cooling',
+            name='owner',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='cooling_model_owner', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.1.6 on 2026-10-18 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cooling', '0002_solveresult'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cooling',
+            name='updated',
+            field=models.DateTimeField(auto_now=True, null=True),
+        ),
+    ]
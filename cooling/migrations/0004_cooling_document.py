@@ -0,0 +1,35 @@
+# Generated by Django 3.1.6 on 2026-10-18 11:20
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+# Copy the array columns into the document; the index is built afterwards.
+FILL_DOCUMENT = """
+UPDATE cooling_model SET document = jsonb_build_object(
+    'components', to_jsonb(components),
+    'losses', to_jsonb(losses),
+    'faces', to_jsonb(faces),
+    'passages', to_jsonb(passages),
+    'fluids', to_jsonb(fluids)
+)
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cooling', '0003_cooling_updated'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cooling',
+            name='document',
+            field=models.JSONField(editable=False, null=True),
+        ),
+        migrations.RunSQL(FILL_DOCUMENT, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='cooling',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['document'], name='cooling_model_document_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
@@ -1,12 +1,40 @@
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models import JSONField
 from accounts.models import CustomUser
 
+# The JSON array columns of a saved model; list views leave them out unless expanded.
+ARRAY_FIELDS = ('components', 'losses', 'faces', 'passages', 'fluids')
+
+
+class CoolingQuerySet(models.QuerySet):
+
+    def containing(self, criteria):
+        """
+        Models whose array columns contain ``criteria``, e.g.
+        ``{"components": [{"parameters": {"slots": 72}}], "fluids": [{"name": "Air"}]}``;
+        answered from the GIN index on ``document``.
+        """
+        return self.filter(document__contains=criteria)
+
+
+class CoolingManager(models.Manager.from_queryset(CoolingQuerySet)):
+
+    def get_queryset(self):
+        # ``document`` repeats the array columns and is only read by queries
+        return super(CoolingManager, self).get_queryset().defer('document')
+
 
 class Cooling(models.Model):
+    """
+    A saved model.  The array columns are the model's content; ``document``
+    holds the same arrays as one JSONB object, kept up to date on save, so
+    that fleet-wide queries on their content can use a GIN index.
+    """
     class Meta:
         db_table = 'cooling_model'
+        indexes = [GinIndex(fields=['document'], opclasses=['jsonb_path_ops'], name='cooling_model_document_gin')]
 
     name = models.CharField(max_length=200)
     components = ArrayField(JSONField(null=True, blank=True), blank=True, null=True)
@@ -15,3 +43,27 @@ class Cooling(models.Model):
     passages = ArrayField(JSONField(null=True, blank=True), blank=True, null=True)
     fluids = ArrayField(JSONField(null=True, blank=True), blank=True, null=True)
     owner = models.ForeignKey(CustomUser, on_delete=models.SET_NULL, related_name='cooling_model_owner', null=True)
+    updated = models.DateTimeField(auto_now=True, null=True)
+    document = JSONField(null=True, editable=False)
+
+    objects = CoolingManager()
+
+    def save(self, *args, **kwargs):
+        self.document = {name: getattr(self, name) for name in ARRAY_FIELDS}
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and set(update_fields) & set(ARRAY_FIELDS):
+            kwargs['update_fields'] = set(update_fields) | {'document'}
+        super(Cooling, self).save(*args, **kwargs)
+
+
+class SolveResult(models.Model):
+    """
+    Stored solve result, addressed by the fingerprint of the solved model.
+    """
+    class Meta:
+        db_table = 'cooling_solve_result'
+
+    key = models.CharField(max_length=64, primary_key=True)
+    result = models.BinaryField()
+    size = models.IntegerField()
+    used = models.DateTimeField(db_index=True)
@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class CoolingCursorPagination(CursorPagination):
+    """
+    Keyset pagination on ``id``: each page is an indexed range scan from the
+    cursor, and the cursors stay valid while models are added or deleted.
+    """
+    ordering = 'id'
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
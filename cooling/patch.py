@@ -0,0 +1,207 @@
+"""
+RFC 6902 JSON Patch for saved models.
+
+A patch is applied to the model's ``name`` and array columns as one JSON
+document, e.g. ``{"op": "replace", "path": "/losses/3/loss", "value": 5000}``.
+Patches made only of ``replace`` operations inside existing array elements,
+the usual edit of a loss or parameter value, are run as a single UPDATE that
+rewrites just those elements (and the same values in ``document``) with
+``jsonb_set``; anything else is applied to
+the loaded model and saved through the serializer.
+"""
+import copy
+import json
+import re
+
+from django.db import connection
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import JSONParser
+
+from cooling.models import ARRAY_FIELDS, Cooling
+
+OPERATIONS = ('add', 'remove', 'replace', 'move', 'copy', 'test')
+
+# The members of a model a patch may change.
+PATCH_FIELDS = ('name',) + ARRAY_FIELDS
+
+INDEX = re.compile(r'0|[1-9][0-9]*')
+
+# Tokens that Postgres reads the same way as RFC 6901 does: array indices
+# in canonical form and object keys that cannot be taken for an index.
+SQL_TOKEN = re.compile(r'0|[1-9][0-9]*|[A-Za-z_][\w .]*')
+
+
+class JSONPatchParser(JSONParser):
+    media_type = 'application/json-patch+json'
+
+
+def _error(message):
+    return ValidationError({'patch': message})
+
+
+def parse_pointer(path):
+    """
+    Reference tokens of a JSON pointer.
+    """
+    if not isinstance(path, str) or (path and not path.startswith('/')):
+        raise _error('"%s" is not a JSON pointer' % path)
+    return [token.replace('~1', '/').replace('~0', '~') for token in path.split('/')[1:]]
+
+
+def check_patch(operations):
+    """
+    The operations of a patch with their pointers parsed, as
+    ``(op, tokens, value, from_tokens)``.
+    """
+    if not isinstance(operations, list):
+        raise _error('A JSON Patch must be a list of operations')
+    checked = []
+    for operation in operations:
+        if not isinstance(operation, dict) or operation.get('op') not in OPERATIONS:
+            raise _error('Operations need an "op" out of %s' % ', '.join(OPERATIONS))
+        op = operation['op']
+        tokens = parse_pointer(operation.get('path'))
+        if not tokens or tokens[0] not in PATCH_FIELDS:
+            raise _error('Paths must start with one of %s' % ', '.join('/' + name for name in PATCH_FIELDS))
+        if op in ('add', 'replace', 'test') and 'value' not in operation:
+            raise _error('"%s" needs a "value"' % op)
+        source = None
+        if op in ('move', 'copy'):
+            source = parse_pointer(operation.get('from'))
+            if not source or source[0] not in PATCH_FIELDS:
+                raise _error('"from" must start with one of %s' % ', '.join('/' + name for name in PATCH_FIELDS))
+        checked.append((op, tokens, operation.get('value'), source))
+    return checked
+
+
+def _index(container, token, path, append=False):
+    if append and token == '-':
+        return len(container)
+    if not INDEX.fullmatch(token) or int(token) > len(container) - (0 if append else 1):
+        raise _error('"%s" is not in the model' % path)
+    return int(token)
+
+
+def _parent(document, tokens):
+    target = document
+    for position, token in enumerate(tokens[:-1]):
+        path = '/' + '/'.join(tokens[:position + 1])
+        if isinstance(target, list):
+            target = target[_index(target, token, path)]
+        elif isinstance(target, dict) and token in target:
+            target = target[token]
+        else:
+            raise _error('"%s" is not in the model' % path)
+    return target
+
+
+def _get(document, tokens):
+    parent = _parent(document, tokens)
+    path = '/' + '/'.join(tokens)
+    if isinstance(parent, list):
+        return parent[_index(parent, tokens[-1], path)]
+    if isinstance(parent, dict) and tokens[-1] in parent:
+        return parent[tokens[-1]]
+    raise _error('"%s" is not in the model' % path)
+
+
+def _remove(document, tokens):
+    parent = _parent(document, tokens)
+    path = '/' + '/'.join(tokens)
+    if isinstance(parent, list):
+        return parent.pop(_index(parent, tokens[-1], path))
+    if isinstance(parent, dict) and tokens[-1] in parent:
+        return parent.pop(tokens[-1])
+    raise _error('"%s" is not in the model' % path)
+
+
+def _add(document, tokens, value):
+    parent = _parent(document, tokens)
+    path = '/' + '/'.join(tokens)
+    if isinstance(parent, list):
+        parent.insert(_index(parent, tokens[-1], path, append=True), value)
+    elif isinstance(parent, dict):
+        parent[tokens[-1]] = value
+    else:
+        raise _error('"%s" is not in the model' % path)
+
+
+def apply_patch(document, operations):
+    """
+    Copy of ``document`` with the checked ``operations`` applied in order.
+    """
+    document = copy.deepcopy(document)
+    for op, tokens, value, source in operations:
+        if len(tokens) == 1 and op in ('add', 'replace'):
+            # the members themselves always exist
+            document[tokens[0]] = copy.deepcopy(value)
+        elif len(tokens) == 1 and op != 'test':
+            raise _error('/%s can only be replaced' % tokens[0])
+        elif op == 'add':
+            _add(document, tokens, copy.deepcopy(value))
+        elif op == 'remove':
+            _remove(document, tokens)
+        elif op == 'replace':
+            _remove(document, tokens)
+            _add(document, tokens, copy.deepcopy(value))
+        elif op == 'move':
+            if tokens[:len(source)] == source and tokens != source:
+                raise _error('Cannot move "/%s" into itself' % '/'.join(source))
+            _add(document, tokens, _remove(document, source))
+        elif op == 'copy':
+            _add(document, tokens, copy.deepcopy(_get(document, source)))
+        elif _get(document, tokens) != value:
+            raise _error('Test of "/%s" failed' % '/'.join(tokens))
+    return document
+
+
+def element_updates(operations):
+    """
+    ``{(column, index): [(tokens, value), ...]}`` when every operation
+    replaces a value inside an array element, else None.
+    """
+    updates = {}
+    for op, tokens, value, _ in operations:
+        if op != 'replace' or tokens[0] not in ARRAY_FIELDS or len(tokens) < 2 or not INDEX.fullmatch(tokens[1]):
+            return None
+        if not all(SQL_TOKEN.fullmatch(token) for token in tokens[2:]):
+            return None
+        updates.setdefault((tokens[0], int(tokens[1])), []).append((tokens[2:], value))
+    return updates
+
+
+def patch_elements(pk, updates):
+    """
+    Apply ``element_updates`` to the stored model in one UPDATE.  Returns
+    False, changing nothing, when a replaced value does not exist.
+    """
+    assignments, conditions = [], []
+    assignment_params, condition_params = [], []
+    for (column, index), replacements in updates.items():
+        # columns come from ARRAY_FIELDS; Postgres arrays count from 1
+        element = '%s[%d]' % (column, index + 1)
+        expression, params = element, []
+        for tokens, value in replacements:
+            if tokens:
+                expression = 'jsonb_set(%s, %%s, %%s::jsonb, false)' % expression
+                params += [tokens, json.dumps(value)]
+                conditions.append('%s #> %%s IS NOT NULL' % element)
+                condition_params.append(tokens)
+            else:
+                expression, params = '%s::jsonb', [json.dumps(value)]
+                conditions.append('%s IS NOT NULL' % element)
+        assignments.append('%s = %s' % (element, expression))
+        assignment_params += params
+    # the same replacements in the document copy of the arrays
+    document = 'document'
+    for (column, index), replacements in updates.items():
+        for tokens, value in replacements:
+            document = 'jsonb_set(%s, %%s, %%s::jsonb, false)' % document
+            assignment_params += [[column, str(index)] + tokens, json.dumps(value)]
+    assignments.append('document = %s' % document)
+    sql = 'UPDATE %s SET %s, updated = %%s WHERE id = %%s AND %s' % (
+        Cooling._meta.db_table, ', '.join(assignments), ' AND '.join(conditions))
+    with connection.cursor() as cursor:
+        cursor.execute(sql, assignment_params + [timezone.now(), pk] + condition_params)
+        return cursor.rowcount == 1
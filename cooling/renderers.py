@@ -0,0 +1,218 @@
+import json
+import struct
+
+import numpy as np
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils import encoders
+
+# Result values sent as raw arrays by ``BinaryResultRenderer``.
+ARRAY_KEYS = ('temperatures', 'avg_temperatures', 'max_temperatures', 'axial_coordinates', 'times')
+
+# Result values that ``precision`` and the binary encodings apply to.
+TEMPERATURE_KEYS = ('temperatures', 'avg_temperatures', 'max_temperatures', 'Temperature', 'AvgTemperature',
+                    'MaxTemperature', 'InletTemperature', 'OutletTemperature', 'TemperatureRise')
+
+# Values per piece of a streamed array and characters per streamed chunk.
+STREAM_CHUNK = 4096
+STREAM_BUFFER = 65536
+
+MAX_PRECISION = 10
+ENCODINGS = ('float64', 'float16', 'fixed')
+FIXED_PRECISION = 2
+
+
+def output_options(request):
+    """
+    ``(precision, encoding)`` from the ``precision`` and ``encoding`` query
+    parameters; raises ValidationError for values out of range.
+    """
+    precision = request.query_params.get('precision')
+    if precision is not None:
+        try:
+            precision = int(precision)
+        except ValueError:
+            precision = -1
+        if not 0 <= precision <= MAX_PRECISION:
+            raise ValidationError({'precision': 'Must be a whole number of decimals from 0 to %d' % MAX_PRECISION})
+    encoding = request.query_params.get('encoding', 'float64')
+    if encoding not in ENCODINGS:
+        raise ValidationError({'encoding': 'Must be one of %s' % ', '.join(ENCODINGS)})
+    return precision, encoding
+
+
+def round_temperatures(value, precision, key=None):
+    """
+    Copy of a result with every temperature rounded to ``precision`` decimals.
+    """
+    if isinstance(value, dict):
+        return {k: round_temperatures(item, precision, k) for k, item in value.items()}
+    if key in TEMPERATURE_KEYS and isinstance(value, np.ndarray):
+        return np.round(value, precision)
+    if key in TEMPERATURE_KEYS and isinstance(value, list):
+        return np.round(np.asarray(value, dtype=float), precision).tolist()
+    if isinstance(value, list):
+        return [round_temperatures(item, precision, key) for item in value]
+    if key in TEMPERATURE_KEYS and isinstance(value, float):
+        return round(value, precision)
+    return value
+
+
+def stream_json(value, size=STREAM_BUFFER):
+    """
+    ``value`` encoded as JSON in pieces of about ``size`` characters.
+    """
+    pieces, length = [], 0
+    for piece in _json_pieces(value, STREAM_CHUNK):
+        pieces.append(piece)
+        length += len(piece)
+        if length >= size:
+            yield ''.join(pieces)
+            pieces, length = [], 0
+    if pieces:
+        yield ''.join(pieces)
+
+
+def _json_pieces(value, chunk):
+    """
+    Encode ``value`` as JSON piece by piece: arrays go out one row (or one
+    ``chunk`` of values) at a time and lists one item at a time, so the
+    whole body never exists as one string.
+    """
+    if isinstance(value, dict):
+        yield '{'
+        for index, (key, item) in enumerate(value.items()):
+            yield '%s%s:' % (',' if index else '', json.dumps(str(key)))
+            yield from _json_pieces(item, chunk)
+        yield '}'
+    elif isinstance(value, np.ndarray) and value.ndim > 1:
+        yield '['
+        for index, row in enumerate(value):
+            if index:
+                yield ','
+            yield from _json_pieces(row, chunk)
+        yield ']'
+    elif isinstance(value, np.ndarray):
+        yield '['
+        for start in range(0, len(value), chunk):
+            yield (',' if start else '') + json.dumps(value[start:start + chunk].tolist())[1:-1]
+        yield ']'
+    elif isinstance(value, (list, tuple)):
+        yield '['
+        for index, item in enumerate(value):
+            if index:
+                yield ','
+            yield from _json_pieces(item, chunk)
+        yield ']'
+    else:
+        yield json.dumps(value, cls=encoders.JSONEncoder)
+
+
+def ndjson_lines(rows):
+    """
+    Each of ``rows`` as one line of JSON.
+    """
+    for row in rows:
+        yield json.dumps(row, cls=encoders.JSONEncoder, separators=(',', ':')) + '\n'
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Newline-delimited JSON, one line per item of a list.  Exports stream
+    their rows through ``ndjson_lines`` and only use this for negotiation
+    and error responses.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return ''.join(ndjson_lines(data if isinstance(data, list) else [data])).encode('utf-8')
+
+
+class ColumnarJSONRenderer(JSONRenderer):
+    """
+    JSON selected with ``?format=columnar``; solve views return the winding
+    temperatures one array per grid instead of one dict per node.
+    """
+    format = 'columnar'
+    columnar = True
+
+
+class BinaryResultRenderer(BaseRenderer):
+    """
+    Columnar solve results with the arrays as raw little-endian numbers.
+
+    The body is a uint32 header length, the UTF-8 JSON header, zero padding
+    up to a multiple of 8 bytes and then the arrays back to back.  In the
+    header every array is replaced by ``{"dtype": "<f8", "offset": ...,
+    "shape": [...]}`` with the offset counted from the end of the padding, so
+    ``np.frombuffer(body, dtype, count=prod(shape), offset=start + offset)``
+    reads it without a copy.
+
+    ``?encoding=float16`` sends temperatures as ``<f2`` (about 0.1 K
+    resolution at machine temperatures) and ``?encoding=fixed`` as integers
+    in units of ``10**-precision`` K (0.01 K by default) as the smallest of
+    ``<i2``, ``<i4`` and ``<i8`` that holds them, with the unit given as
+    ``"scale"``.
+    """
+    media_type = 'application/octet-stream'
+    format = 'bin'
+    charset = None
+    render_style = 'binary'
+    columnar = True
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        precision, encoding = None, 'float64'
+        request = (renderer_context or {}).get('request')
+        if request is not None:
+            try:
+                precision, encoding = output_options(request)
+            except ValidationError:
+                # the view has already answered 400; render that plainly
+                pass
+        if precision is None:
+            precision = FIXED_PRECISION
+        arrays = []
+        header = self._header(data, arrays, encoding, precision)
+        header = json.dumps(header, separators=(',', ':')).encode('utf-8')
+        body = struct.pack('<I', len(header)) + header
+        padding = b'\0' * (-len(body) % 8)
+        return b''.join([body, padding] + [array.tobytes() for array in arrays])
+
+    def _header(self, value, arrays, encoding, precision):
+        if isinstance(value, dict):
+            return {key: (self._array(item, arrays, encoding if key in TEMPERATURE_KEYS else 'float64', precision)
+                          if key in ARRAY_KEYS else self._header(item, arrays, encoding, precision))
+                    for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._header(item, arrays, encoding, precision) for item in value]
+        return value
+
+    def _array(self, value, arrays, encoding, precision):
+        array = np.asarray(value, dtype=float)
+        described = {}
+        if encoding == 'float16':
+            array = array.astype('<f2')
+        elif encoding == 'fixed':
+            scale = 10.0 ** -precision
+            array = np.round(array / scale)
+            largest = np.abs(array).max() if array.size else 0
+            # the smallest integer type that holds every value
+            dtype = next(dtype for dtype in ('<i2', '<i4', '<i8') if largest <= np.iinfo(dtype).max)
+            array = array.astype(dtype)
+            described['scale'] = scale
+        else:
+            array = array.astype('<f8')
+        offset = sum(previous.nbytes for previous in arrays)
+        if offset % 8:
+            # start every array on an 8-byte boundary
+            arrays.append(np.zeros(-offset % 8, np.uint8))
+            offset += arrays[-1].nbytes
+        arrays.append(np.ascontiguousarray(array))
+        described.update({'dtype': array.dtype.str, 'offset': offset, 'shape': list(array.shape)})
+        return described
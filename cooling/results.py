@@ -0,0 +1,124 @@
+"""
+Solve results addressed by the fingerprint of the solved model.
+
+Page reloads and shared designs post the same model again and again, so
+results are kept, encoded as JSON, in two tiers: an in-process LRU and the
+``SolveResult`` table, which outlives worker restarts and is shared between
+workers.  Both tiers are bounded by size; every EVICT_INTERVAL bytes a
+process writes, the table drops its least recently used rows until they add
+up to no more than EVICT_TO bytes, so it stays near STORE_SIZE.  The table
+is only a cache, so database errors fall back to solving.
+"""
+import threading
+import zlib
+
+from django.db import DatabaseError
+from django.db.models import Sum
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from cooling.models import SolveResult
+from cooling.thermal.cache import LRUCache, model_fingerprint
+
+# bytes of encoded results held in memory per process and in the table
+MEMORY_SIZE = 64 * 1024 * 1024
+STORE_SIZE = 1024 * 1024 * 1024
+
+# Larger results are not kept in memory.
+MAX_MEMORY_ENTRY = MEMORY_SIZE // 8
+
+# Bytes stored by a process between checks of the table size, and the size
+# the table is trimmed to when it is over STORE_SIZE.
+EVICT_INTERVAL = STORE_SIZE // 32
+EVICT_TO = STORE_SIZE * 7 // 8
+
+RESULTS = LRUCache(maxsize=MEMORY_SIZE)
+
+_written = 0
+_written_lock = threading.Lock()
+
+
+def result_key(model, columnar=False):
+    return model_fingerprint(model) + ('-columnar' if columnar else '')
+
+
+def cached_result(key):
+    """
+    The stored result for ``key`` encoded as JSON, or None.
+    """
+    encoded = RESULTS.get(key)
+    if encoded is not None:
+        return encoded
+    try:
+        stored = SolveResult.objects.filter(key=key).first()
+        if stored is None:
+            return None
+        SolveResult.objects.filter(key=key).update(used=timezone.now())
+    except DatabaseError:
+        return None
+    encoded = zlib.decompress(bytes(stored.result))
+    if len(encoded) <= MAX_MEMORY_ENTRY:
+        RESULTS.put(key, encoded, size=len(encoded))
+    return encoded
+
+
+def store_result(key, result):
+    """
+    Encode ``result`` as JSON once, store it and return the encoding.
+    """
+    encoded = JSONRenderer().render(result)
+    if len(encoded) <= MAX_MEMORY_ENTRY:
+        RESULTS.put(key, encoded, size=len(encoded))
+    _store(key, zlib.compress(encoded, 6))
+    return encoded
+
+
+def stream_result(key, chunks):
+    """
+    Pass the JSON ``chunks`` of a streamed result through, compressing them
+    as they go, and store the result once the last one has been sent.
+    Only the compressed bytes are held, so the stream stays lean.
+    """
+    compressor, compressed = zlib.compressobj(6), []
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        compressed.append(compressor.compress(chunk))
+        yield chunk
+    compressed.append(compressor.flush())
+    _store(key, b''.join(compressed))
+
+
+def _store(key, compressed):
+    global _written
+    try:
+        SolveResult.objects.update_or_create(
+            key=key, defaults=dict(result=compressed, size=len(compressed), used=timezone.now()))
+    except DatabaseError:
+        return
+    with _written_lock:
+        _written += len(compressed)
+        if _written < EVICT_INTERVAL:
+            return
+        _written = 0
+    try:
+        _evict()
+    except DatabaseError:
+        pass
+
+
+def _evict():
+    """
+    Delete the least recently used rows once the table is over STORE_SIZE,
+    until it fits EVICT_TO.
+    """
+    total = SolveResult.objects.aggregate(total=Sum('size'))['total'] or 0
+    if total <= STORE_SIZE:
+        return
+    excess, keys = total - EVICT_TO, []
+    for key, size in SolveResult.objects.order_by('used').values_list('key', 'size').iterator():
+        keys.append(key)
+        excess -= size
+        if excess <= 0:
+            break
+    SolveResult.objects.filter(key__in=keys).delete()
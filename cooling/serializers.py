@@ -1,15 +1,51 @@
 from rest_framework import serializers
 
+from accounts.models import CustomUser
 from accounts.serializers import UserRegistrationSerializer
-from cooling.models import Cooling
+from cooling.models import ARRAY_FIELDS, Cooling
+
+
+class OwnerField(serializers.PrimaryKeyRelatedField):
+    """
+    Owner written as a user id and shown as the nested user.  Views load
+    owners with ``select_related('owner')`` so listing models costs no
+    query per row.
+    """
+
+    def use_pk_only_optimization(self):
+        return False
+
+    def to_representation(self, value):
+        return UserRegistrationSerializer(value, context=self.context).data
 
 
 class CoolingSerializer(serializers.ModelSerializer):
+    owner = OwnerField(queryset=CustomUser.objects.all(), allow_null=True, required=False)
+
     class Meta:
         model = Cooling
         fields = ('id', 'name', 'components', 'losses', 'faces', 'passages', 'fluids', 'owner')
         read_only_fields = ()
 
-    def to_representation(self, instance):
-        self.fields['owner'] = UserRegistrationSerializer(read_only=True)
-        return super(CoolingSerializer, self).to_representation(instance)
+
+class CoolingSummarySerializer(CoolingSerializer):
+    """
+    A saved model as listed in a model picker: the lengths of its array
+    columns instead of their content, except for the columns named in the
+    ``expand`` context entry.
+    """
+    components_count = serializers.IntegerField(read_only=True)
+    losses_count = serializers.IntegerField(read_only=True)
+    faces_count = serializers.IntegerField(read_only=True)
+    passages_count = serializers.IntegerField(read_only=True)
+    fluids_count = serializers.IntegerField(read_only=True)
+
+    class Meta(CoolingSerializer.Meta):
+        fields = ('id', 'name', 'owner', 'updated') + tuple('%s_count' % name for name in ARRAY_FIELDS) + ARRAY_FIELDS
+
+    def __init__(self, *args, **kwargs):
+        super(CoolingSummarySerializer, self).__init__(*args, **kwargs)
+        expand = self.context.get('expand', ())
+        for name in ARRAY_FIELDS:
+            if name not in expand:
+                self.fields.pop(name)
@@ -1,3 +1,561 @@
-from django.test import TestCase
+import copy
+import gzip
+import json
+import os
+import struct
+import zlib
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from accounts.models import CustomUser
+from cooling import results
+from cooling.compression import CODECS, PRECOMPRESSED, negotiate
+from cooling.demo import DEMO_MODEL, demo_model
+from cooling.models import ARRAY_FIELDS, Cooling, SolveResult
+from cooling.thermal.cache import canonical_model, model_fingerprint
+from cooling.thermal.solver import FACTORIZATIONS
+from cooling.renderers import BinaryResultRenderer, output_options, round_temperatures, stream_json
+
+
+class CoolingTestCase(TestCase):
+    """
+    Base for API tests: a client authenticated as a staff user.
+    """
+
+    def setUp(self):
+        self.admin = CustomUser.objects.create_user(email='admin@example.com', password='secret', is_staff=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def add_models(self, count, owner=None):
+        for index in range(count):
+            user = owner or CustomUser.objects.create_user(email='user%d@example.com' % Cooling.objects.count(),
+                                                           password='secret')
+            Cooling.objects.create(name='Model %d' % index, components=[{'type': 'Stator'}], losses=[], owner=user)
+
+
+class QueryCountTestCase(CoolingTestCase):
+    """
+    Base for tests that pin how many queries an endpoint makes, so that a
+    list does not go back to one query per row.
+    """
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def assertQueriesIndependentOfRows(self, url, add_rows, rows=10):
+        """
+        ``url`` makes as many queries after ``add_rows(rows)`` as before.
+        """
+        before = self.count_queries(url)
+        add_rows(rows)
+        self.assertEqual(self.count_queries(url), before, '%s makes more queries with more rows' % url)
+
+
+class CoolingListQueryTest(QueryCountTestCase):
+
+    def test_admin_list(self):
+        self.add_models(1)
+        self.assertQueriesIndependentOfRows('/api/cooling', self.add_models)
+        with self.assertNumQueries(1):
+            self.client.get('/api/cooling')
+
+    def test_admin_list_expanded(self):
+        self.add_models(1)
+        self.assertQueriesIndependentOfRows('/api/cooling?expand=all', self.add_models)
+        with self.assertNumQueries(1):
+            self.client.get('/api/cooling?expand=all')
+
+    def test_my_list(self):
+        self.add_models(1, owner=self.admin)
+        self.assertQueriesIndependentOfRows('/api/cooling/me', lambda rows: self.add_models(rows, owner=self.admin))
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/cooling/me')
+        self.assertEqual(response.data['results'][0]['owner']['email'], self.admin.email)
+
+    def test_detail(self):
+        self.add_models(1, owner=self.admin)
+        url = '/api/cooling/%d' % Cooling.objects.get().pk
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.data['owner']['email'], self.admin.email)
+
+
+class CoolingSummaryTest(CoolingTestCase):
+
+    def setUp(self):
+        super(CoolingSummaryTest, self).setUp()
+        Cooling.objects.create(name='Model', components=[{'type': 'Stator'}, {'type': 'Rotor'}],
+                               losses=[{'name': 'Core', 'loss': 7000}], faces=[], owner=self.admin)
+
+    def test_summary(self):
+        summary = self.client.get('/api/cooling/me').data['results'][0]
+        self.assertEqual(summary['name'], 'Model')
+        self.assertEqual(summary['owner']['email'], self.admin.email)
+        self.assertIsNotNone(summary['updated'])
+        self.assertEqual([summary[name] for name in ('components_count', 'losses_count', 'faces_count',
+                                                     'passages_count', 'fluids_count')], [2, 1, 0, None, None])
+        self.assertFalse(set(ARRAY_FIELDS) & set(summary))
+
+    def test_expand_columns(self):
+        summary = self.client.get('/api/cooling/me?expand=losses').data['results'][0]
+        self.assertEqual(summary['losses'], [{'name': 'Core', 'loss': 7000}])
+        self.assertEqual(summary['losses_count'], 1)
+        self.assertNotIn('components', summary)
+
+    def test_expand_all(self):
+        model = self.client.get('/api/cooling/me?expand=all').data['results'][0]
+        self.assertEqual(set(model), {'id', 'name', 'owner'} | set(ARRAY_FIELDS))
+
+    def test_expand_unknown(self):
+        response = self.client.get('/api/cooling/me?expand=losses,owner')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('expand', response.data)
+
+
+class CoolingPaginationTest(CoolingTestCase):
+
+    def test_cursor_pages(self):
+        self.add_models(5, owner=self.admin)
+        url, ids = '/api/cooling/me?page_size=2', []
+        while url:
+            response = self.client.get(url)
+            ids.extend(model['id'] for model in response.data['results'])
+            url = response.data['next']
+        self.assertEqual(ids, sorted(Cooling.objects.values_list('id', flat=True)))
+
+
+class CoolingExportTest(CoolingTestCase):
+
+    def export(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        return [json.loads(line) for line in b''.join(response.streaming_content).decode('utf-8').splitlines()]
+
+    def test_export(self):
+        self.add_models(2, owner=self.admin)
+        self.add_models(3)
+        rows = self.export('/api/cooling/export')
+        self.assertEqual([row['id'] for row in rows], sorted(Cooling.objects.values_list('id', flat=True)))
+        self.assertEqual(rows[0]['components'], [{'type': 'Stator'}])
+        self.assertEqual(rows[0]['owner']['email'], self.admin.email)
+
+    def test_my_export(self):
+        self.add_models(2, owner=self.admin)
+        self.add_models(3)
+        rows = self.export('/api/cooling/me/export')
+        self.assertEqual(len(rows), 2)
+        self.assertTrue(all(row['owner']['id'] == self.admin.id for row in rows))
+
+    def test_export_needs_staff(self):
+        self.client.force_authenticate(CustomUser.objects.create_user(email='user@example.com', password='secret'))
+        self.assertEqual(self.client.get('/api/cooling/export').status_code, 403)
+        self.assertEqual(self.export('/api/cooling/me/export'), [])
+
+
+class CoolingPatchTest(CoolingTestCase):
+
+    def setUp(self):
+        super(CoolingPatchTest, self).setUp()
+        self.model = Cooling.objects.create(name='Model', components=[{'type': 'Stator', 'parameters': {'slots': 72}}],
+                                            losses=[{'name': 'Core', 'loss': 7000}, {'name': 'Tooth', 'loss': 4000}],
+                                            owner=self.admin)
+        self.url = '/api/cooling/%d' % self.model.pk
+
+    def patch(self, operations):
+        return self.client.patch(self.url, operations, format='json')
+
+    def test_replace_in_element(self):
+        with self.assertNumQueries(3):
+            response = self.patch([{'op': 'replace', 'path': '/losses/1/loss', 'value': 5000},
+                                   {'op': 'replace', 'path': '/components/0/parameters/slots', 'value': 48}])
+        self.assertEqual(response.status_code, 200)
+        self.model.refresh_from_db()
+        self.assertEqual(self.model.losses, [{'name': 'Core', 'loss': 7000}, {'name': 'Tooth', 'loss': 5000}])
+        self.assertEqual(self.model.components[0]['parameters'], {'slots': 48})
+
+    def test_replace_keeps_document(self):
+        self.patch([{'op': 'replace', 'path': '/components/0/parameters/slots', 'value': 48}])
+        containing = Cooling.objects.containing
+        self.assertFalse(containing({'components': [{'parameters': {'slots': 72}}]}).exists())
+        self.assertTrue(containing({'components': [{'parameters': {'slots': 48}}]}).exists())
+
+    def test_structural_operations(self):
+        response = self.patch([{'op': 'add', 'path': '/losses/-', 'value': {'name': 'Pole', 'loss': 100}},
+                               {'op': 'remove', 'path': '/losses/0'},
+                               {'op': 'replace', 'path': '/name', 'value': 'Renamed'}])
+        self.assertEqual(response.status_code, 200)
+        self.model.refresh_from_db()
+        self.assertEqual([loss['name'] for loss in self.model.losses], ['Tooth', 'Pole'])
+        self.assertEqual(self.model.name, 'Renamed')
+
+    def test_missing_path(self):
+        response = self.patch([{'op': 'replace', 'path': '/losses/5/loss', 'value': 1}])
+        self.assertEqual(response.status_code, 400)
+        self.model.refresh_from_db()
+        self.assertEqual(self.model.losses[1]['loss'], 4000)
+
+
+class CoolingContainsTest(CoolingTestCase):
+
+    def test_contains(self):
+        Cooling.objects.create(name='Air', components=[{'type': 'Stator', 'parameters': {'slots': 72}}],
+                               fluids=[{'name': 'Air'}], owner=self.admin)
+        Cooling.objects.create(name='Water', components=[{'type': 'Stator', 'parameters': {'slots': 72}}],
+                               fluids=[{'name': 'Water'}], owner=self.admin)
+        response = self.client.get('/api/cooling', {'contains': json.dumps(
+            {'components': [{'parameters': {'slots': 72}}], 'fluids': [{'name': 'Air'}]})})
+        self.assertEqual([model['name'] for model in response.data['results']], ['Air'])
+        self.assertEqual(self.client.get('/api/cooling', {'contains': '[1]'}).status_code, 400)
+
+
+def decode_binary(body):
+    """
+    The header of a ``BinaryResultRenderer`` body with every array it
+    describes read back into its ``values``.
+    """
+    length = struct.unpack('<I', body[:4])[0]
+    start = 4 + length + -(4 + length) % 8
+
+    def read(value):
+        if isinstance(value, dict) and 'dtype' in value and 'offset' in value:
+            values = np.frombuffer(body, value['dtype'], count=int(np.prod(value['shape'])),
+                                   offset=start + value['offset'])
+            return dict(value, values=values.reshape(value['shape']))
+        if isinstance(value, dict):
+            return {key: read(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [read(item) for item in value]
+        return value
+
+    return read(json.loads(body[4:4 + length].decode('utf-8')))
+
+
+class SolveTestCase(SimpleTestCase):
+    """
+    Base for solve endpoint tests that need no database: a client
+    authenticated as an unsaved staff user and a copy of the demo model.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(CustomUser(id=1, email='admin@example.com', is_staff=True))
+        self.model = copy.deepcopy(demo_model()[0])
+
+
+class BatchSolveTest(SolveTestCase):
+
+    def setUp(self):
+        super(BatchSolveTest, self).setUp()
+        self.batch = {'model': self.model, 'speeds': [500, 1500]}
+
+    def post(self, url='/api/cooling/solve/batch', **extra):
+        response = self.client.post(url, self.batch, format='json', **extra)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_binary(self):
+        result = self.post().json()
+        response = self.post(HTTP_ACCEPT='application/octet-stream')
+        self.assertEqual(response['Content-Type'], 'application/octet-stream')
+        header = decode_binary(response.content)
+        self.assertEqual(header['components'], result['components'])
+        self.assertEqual(header['cases'], 2)
+        np.testing.assert_array_equal(header['avg_temperatures']['values'], result['avg_temperatures'])
+        for array, expected in zip(header['windings'], result['windings']):
+            self.assertEqual(array['temperatures']['dtype'], '<f8')
+            self.assertEqual(array['temperatures']['offset'] % 8, 0)
+            np.testing.assert_array_equal(array['temperatures']['values'], expected['temperatures'])
+
+    def test_stream(self):
+        result = self.post().json()
+        response = self.post('/api/cooling/solve/batch?stream=1')
+        self.assertTrue(response.streaming)
+        self.assertEqual(json.loads(b''.join(response.streaming_content).decode('utf-8')), result)
+
+    def test_stream_json_pieces(self):
+        value = {'a': np.arange(10000.0).reshape(2, 5000), 'b': [1, {'c': None}], 'd': 'x'}
+        pieces = list(stream_json(value, size=1000))
+        self.assertGreater(len(pieces), 2)
+        self.assertEqual(json.loads(''.join(pieces)), {'a': value['a'].tolist(), 'b': [1, {'c': None}], 'd': 'x'})
+
+    def test_fixed_precision(self):
+        result = self.post().json()
+        header = decode_binary(self.post('/api/cooling/solve/batch?encoding=fixed&precision=8',
+                                         HTTP_ACCEPT='application/octet-stream').content)
+        for array, expected in zip(header['windings'], result['windings']):
+            temperatures = array['temperatures']
+            self.assertEqual((temperatures['dtype'], temperatures['scale']), ('<i8', 1e-8))
+            np.testing.assert_allclose(temperatures['values'] * temperatures['scale'], expected['temperatures'],
+                                       rtol=0, atol=1e-8)
+            # coordinates are not quantised
+            self.assertEqual(array['axial_coordinates']['dtype'], '<f8')
+
+    def test_unbalanced_junction(self):
+        self.model['passages'][1]['flow_rate'] = 3.0
+        response = self.client.post('/api/cooling/solve/batch', {'model': self.model, 'speeds': [500]}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Flow is not conserved', response.json()['detail'])
+
+    def test_no_path_to_ambient(self):
+        model = dict(self.model, faces=[], passages=[])
+        response = self.client.post('/api/cooling/solve/batch', {'model': model, 'speeds': [500]}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('has no path to ambient', response.json()['detail'])
+
+
+class OutputEncodingTest(SimpleTestCase):
+
+    def render(self, temperatures, query):
+        request = Request(APIRequestFactory().get('/api/cooling/solve' + query))
+        body = BinaryResultRenderer().render({'temperatures': np.asarray(temperatures)},
+                                             renderer_context={'request': request})
+        return decode_binary(body)['temperatures']
+
+    def assertFixed(self, temperatures, precision, dtype):
+        array = self.render(temperatures, '?encoding=fixed&precision=%d' % precision)
+        self.assertEqual(array['dtype'], dtype)
+        self.assertEqual(array['scale'], 10.0 ** -precision)
+        np.testing.assert_allclose(array['values'] * array['scale'], temperatures, rtol=0,
+                                   atol=0.5 * 10.0 ** -precision * (1 + 1e-6))
+
+    def test_fixed(self):
+        self.assertFixed([57.4812, -3.2, 120.0], 2, '<i2')
+        self.assertFixed([57.4812, 400.12345], 2, '<i4')
+        self.assertFixed([57.4812, 400.123456789], 8, '<i8')
+        self.assertFixed([], 8, '<i2')
+
+    def test_fixed_default_precision(self):
+        array = self.render([57.4812], '?encoding=fixed')
+        self.assertEqual((array['dtype'], array['scale'], array['values'].tolist()), ('<i2', 0.01, [5748]))
+
+    def test_float16(self):
+        temperatures = np.linspace(20.0, 180.0, 50)
+        array = self.render(temperatures, '?encoding=float16')
+        self.assertEqual(array['dtype'], '<f2')
+        np.testing.assert_allclose(array['values'], temperatures, atol=0.07)
+
+    def test_float64(self):
+        temperatures = np.linspace(20.0, 180.0, 7)
+        np.testing.assert_array_equal(self.render(temperatures, '')['values'], temperatures)
+
+    def test_precision(self):
+        result = {'temperatures': np.array([57.4812, 60.0]), 'components': ['Stator'],
+                  'component_temperatures': [{'Name': 'Stator', 'AvgTemperature': 57.4812, 'Count': 1.2345}]}
+        rounded = round_temperatures(result, 1)
+        self.assertEqual(rounded['temperatures'].tolist(), [57.5, 60.0])
+        self.assertEqual(rounded['component_temperatures'], [{'Name': 'Stator', 'AvgTemperature': 57.5,
+                                                              'Count': 1.2345}])
+
+    def test_invalid_options(self):
+        for query in ('?precision=x', '?precision=11', '?precision=-1', '?encoding=int8'):
+            with self.subTest(query=query), self.assertRaises(ValidationError):
+                output_options(Request(APIRequestFactory().get('/api/cooling/solve' + query)))
+
+
+class CompressionTest(SolveTestCase):
+
+    def test_negotiate(self):
+        best = 'br' if 'br' in CODECS else 'zstd' if 'zstd' in CODECS else 'gzip'
+        self.assertEqual(negotiate('gzip'), 'gzip')
+        self.assertEqual(negotiate('gzip;q=0.5, deflate'), 'gzip')
+        self.assertEqual(negotiate('*'), best)
+        self.assertEqual(negotiate('*;q=0.5, gzip'), 'gzip')
+        self.assertIsNone(negotiate('gzip;q=0'))
+        self.assertIsNone(negotiate('identity'))
+        self.assertIsNone(negotiate(None))
+
+    def test_demo_result(self):
+        plain = self.client.get('/api/cooling/demo_result', HTTP_ACCEPT_ENCODING='identity')
+        compressed = self.client.get('/api/cooling/demo_result', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertNotIn('Content-Encoding', plain)
+        self.assertEqual(compressed['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', compressed['Vary'])
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+        self.assertEqual([len(grid) for grid in json.loads(plain.content)['winding_temperatures']], [1710, 220])
+
+    def test_response(self):
+        batch = {'model': self.model, 'speeds': [500]}
+        plain = self.client.post('/api/cooling/solve/batch', batch, format='json')
+        compressed = self.client.post('/api/cooling/solve/batch', batch, format='json', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(compressed['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+
+        streamed = self.client.post('/api/cooling/solve/batch?stream=1', batch, format='json',
+                                    HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(streamed['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(b''.join(streamed.streaming_content))), plain.json())
+
+
+class DemoTest(SolveTestCase):
+
+    def test_not_modified(self):
+        for url in ('/api/cooling/demo_model', '/api/cooling/demo_result'):
+            for coding in ('identity', 'gzip'):
+                response = self.client.get(url, HTTP_ACCEPT_ENCODING=coding)
+                self.assertEqual(response.status_code, 200)
+                for header, value in (('HTTP_IF_NONE_MATCH', response['ETag']),
+                                      ('HTTP_IF_MODIFIED_SINCE', response['Last-Modified'])):
+                    with self.subTest(url=url, coding=coding, header=header):
+                        revalidated = self.client.get(url, HTTP_ACCEPT_ENCODING=coding, **{header: value})
+                        self.assertEqual(revalidated.status_code, 304)
+                        self.assertEqual(revalidated['ETag'], response['ETag'])
+                        self.assertEqual(revalidated.content, b'')
+            self.assertNotEqual(self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')['ETag'],
+                                self.client.get(url, HTTP_ACCEPT_ENCODING='identity')['ETag'])
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH='"other"').status_code, 200)
+
+    def test_model_reloaded_on_change(self):
+        model, mtime = demo_model()
+        self.assertIs(demo_model()[0], model)
+        stat = os.stat(DEMO_MODEL)
+        try:
+            os.utime(DEMO_MODEL, (stat.st_atime, stat.st_mtime + 10))
+            reloaded, reloaded_mtime = demo_model()
+            self.assertIsNot(reloaded, model)
+            self.assertEqual(reloaded, model)
+            self.assertEqual(reloaded_mtime, mtime + 10)
+        finally:
+            os.utime(DEMO_MODEL, (stat.st_atime, stat.st_mtime))
+
+
+class SolveResultCacheTest(CoolingTestCase):
+
+    def setUp(self):
+        super(SolveResultCacheTest, self).setUp()
+        self.model = copy.deepcopy(demo_model()[0])
+        for cache in (results.RESULTS, PRECOMPRESSED, FACTORIZATIONS):
+            cache.clear()
+
+    def solve(self, url='/api/cooling/solve', model=None, **extra):
+        return self.client.post(url, model or self.model, format='json', **extra)
+
+    def forget(self):
+        """
+        Drop everything in memory, so only the table can answer without solving.
+        """
+        for cache in (results.RESULTS, PRECOMPRESSED, FACTORIZATIONS):
+            cache.clear()
+
+    def test_miss_and_hit(self):
+        response = self.solve()
+        self.assertEqual(response.status_code, 200)
+        key = results.result_key(self.model)
+        self.assertEqual(response['ETag'], '"%s.json"' % key)
+        self.assertEqual(json.loads(zlib.decompress(bytes(SolveResult.objects.get(key=key).result))), response.json())
+
+        self.forget()
+        hit = self.solve()
+        self.assertEqual(hit.content, response.content)
+        self.assertEqual(len(FACTORIZATIONS), 0)
+        self.assertEqual(results.RESULTS.get(key), response.content)
+        # a second hit is served from memory
+        with self.assertNumQueries(0):
+            self.assertEqual(self.solve().content, response.content)
+
+    def test_representations(self):
+        plain = self.solve().json()
+        self.forget()
+        columnar = self.solve('/api/cooling/solve?format=columnar')
+        self.assertEqual(columnar['ETag'], '"%s.columnar"' % results.result_key(self.model, columnar=True))
+        self.assertEqual(len(FACTORIZATIONS), 1)
+
+        rounded = self.solve('/api/cooling/solve?precision=1')
+        self.assertNotEqual(rounded['ETag'], self.solve()['ETag'])
+        self.assertEqual(rounded.json()['component_temperatures'][0]['AvgTemperature'],
+                         round(plain['component_temperatures'][0]['AvgTemperature'], 1))
+
+    def test_not_modified(self):
+        compressed = self.solve(HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(compressed['Content-Encoding'], 'gzip')
+        etag = compressed['ETag']
+        self.assertTrue(etag.endswith('-gzip"'))
+        self.forget()
+        SolveResult.objects.all().delete()
+        # answered from the ETag alone, without solving or looking anything up
+        for tag in (etag, 'W/' + etag, etag.replace('-gzip', ''), '"other", ' + etag):
+            with self.subTest(tag=tag), self.assertNumQueries(0):
+                response = self.solve(HTTP_IF_NONE_MATCH=tag, HTTP_ACCEPT_ENCODING='gzip')
+                self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(FACTORIZATIONS), 0)
+        self.assertEqual(self.solve(HTTP_IF_NONE_MATCH='"other"').status_code, 200)
+
+    def test_equivalent_models(self):
+        etag = self.solve()['ETag']
+        self.forget()
+        equivalent = copy.deepcopy(self.model)
+        equivalent['name'] = 'Renamed'
+        equivalent['losses'][0]['loss'] = float(equivalent['losses'][0]['loss'])
+        equivalent['components'].append({'type': 'Housing', 'active': False, 'parameters': {}})
+        self.assertEqual(self.solve(model=equivalent)['ETag'], etag)
+        self.assertEqual(len(FACTORIZATIONS), 0)
+
+    def test_stream_stores_result(self):
+        streamed = self.solve('/api/cooling/solve?stream=1')
+        body = b''.join(streamed.streaming_content)
+        key = results.result_key(self.model)
+        self.assertEqual(zlib.decompress(bytes(SolveResult.objects.get(key=key).result)), body)
+        self.forget()
+        self.assertEqual(self.solve().json(), json.loads(body))
+        self.assertEqual(len(FACTORIZATIONS), 0)
+
+    def test_rounded_stream_not_stored(self):
+        b''.join(self.solve('/api/cooling/solve?stream=1&precision=1').streaming_content)
+        self.assertFalse(SolveResult.objects.exists())
+
+    def test_error_not_stored(self):
+        self.model['components'] = []
+        self.assertEqual(self.solve().status_code, 400)
+        self.assertFalse(SolveResult.objects.exists())
+
+    def test_evict(self):
+        # each row takes 34 bytes; the table is checked every other store
+        with mock.patch.multiple(results, STORE_SIZE=100, EVICT_INTERVAL=50, EVICT_TO=80), \
+                mock.patch.object(results, '_written', 0):
+            for index in range(6):
+                results.store_result('k%d' % index, {'temperatures': [20.0 + index] * 20})
+                self.assertEqual(SolveResult.objects.count(), [1, 2, 3, 2, 3, 2][index])
+        self.assertEqual(list(SolveResult.objects.order_by('used').values_list('key', flat=True)), ['k4', 'k5'])
+
+
+class FingerprintTest(SimpleTestCase):
+
+    def setUp(self):
+        self.model = {'name': 'Model', 'losses': [{'name': 'Core', 'loss': 7000}],
+                      'components': [{'type': 'Stator', 'parameters': {'slots': 36}}]}
+
+    def test_canonical_model(self):
+        canonical = canonical_model(dict(self.model, nonlinear=False, fluids=None))
+        self.assertEqual(canonical, {'losses': [{'name': 'Core', 'loss': 7000.0}],
+                                     'components': [{'type': 'Stator', 'parameters': {'slots': 36.0}}]})
+        self.assertIsInstance(canonical['losses'][0]['loss'], float)
+        self.assertEqual(canonical_model({'losses': [{'loss': -0.0, 'active': True}]}),
+                         {'losses': [{'loss': 0.0, 'active': True}]})
+
+    def test_fingerprint(self):
+        fingerprint = model_fingerprint(self.model)
+        equivalent = copy.deepcopy(self.model)
+        equivalent['name'] = 'Other'
+        equivalent['losses'][0]['loss'] = 7000.0
+        equivalent['components'].append({'type': 'Housing', 'active': False})
+        equivalent['components'].append(None)
+        self.assertEqual(model_fingerprint(equivalent), fingerprint)
+
+        changed = copy.deepcopy(self.model)
+        changed['losses'][0]['loss'] = 7001
+        self.assertNotEqual(model_fingerprint(changed), fingerprint)
+        self.assertNotEqual(model_fingerprint(dict(self.model, nonlinear=True)), fingerprint)
+        self.assertNotEqual(model_fingerprint(dict(self.model, mesh={'axial_slices': 12})), fingerprint)
+        with mock.patch('cooling.thermal.cache.SOLVER_VERSION', -1):
+            self.assertNotEqual(model_fingerprint(self.model), fingerprint)
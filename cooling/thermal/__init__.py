@@ -0,0 +1,4 @@
+from cooling.thermal.exceptions import ThermalModelError
+from cooling.thermal.nonlinear import solve_model_nonlinear
+from cooling.thermal.solver import solve_batch, solve_model
+from cooling.thermal.transient import solve_transient
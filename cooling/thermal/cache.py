@@ -0,0 +1,106 @@
+"""
+In-process LRU caches for solver state that only depends on model geometry.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+# Everything except ``losses`` changes the conductance matrix.
+GEOMETRY_KEYS = ('components', 'faces', 'passages', 'fluids', 'mesh', 'fan')
+
+# Everything a solve reads from the posted model.
+SOLVE_KEYS = GEOMETRY_KEYS + ('losses', 'nonlinear', 'transient')
+
+# Part of every model fingerprint, so stored results of older solver code
+# are not served.  Bump it with any change to the solver, correlations or
+# fluid tables that changes results.
+SOLVER_VERSION = 2
+
+
+def geometry_fingerprint(model):
+    """
+    Stable hash of the parts of a model that define its conductance matrix.
+    """
+    geometry = {key: model.get(key) for key in GEOMETRY_KEYS}
+    encoded = json.dumps(geometry, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+def _canonical(value):
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        # 1, 1.0 and -0.0 alike
+        return float(value) + 0.0
+    return value
+
+
+def canonical_model(model):
+    """
+    The parts of a posted model that a solve reads, with numbers as floats
+    and inactive components and switched-off solve options dropped, so
+    models that solve alike compare equal.
+    """
+    canonical = {key: _canonical(model.get(key)) for key in SOLVE_KEYS if model.get(key) is not None}
+    if isinstance(canonical.get('components'), list):
+        # entries that are not objects are left for the solve to reject
+        canonical['components'] = [component for component in canonical['components']
+                                   if component and (not isinstance(component, dict) or component.get('active', True))]
+    if not canonical.get('nonlinear'):
+        canonical.pop('nonlinear', None)
+    return canonical
+
+
+def model_fingerprint(model):
+    """
+    Stable hash of everything that determines a model's solve result.
+    """
+    encoded = json.dumps([SOLVER_VERSION, canonical_model(model)], sort_keys=True, separators=(',', ':'),
+                         default=str)
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+class LRUCache(object):
+    """
+    Thread-safe mapping that drops the least recently used entries once the
+    held entries add up to more than ``maxsize``.  Each entry counts as one
+    unless it is put with a ``size``.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.size = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value, size=1):
+        with self._lock:
+            self.size += size - self._sizes.get(key, 0)
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._entries.move_to_end(key)
+            while self.size > self.maxsize and self._entries:
+                oldest, _ = self._entries.popitem(last=False)
+                self.size -= self._sizes.pop(oldest)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.size = 0
@@ -0,0 +1,137 @@
+"""
+Heat-transfer coefficient correlations for the convective faces of a model.
+"""
+import math
+
+import numpy as np
+
+from cooling.thermal.exceptions import ThermalModelError
+
+NATURAL_CONVECTION = 10.0
+LAMINAR_NUSSELT = 7.54
+TRANSITION_REYNOLDS = 2300.0
+END_REGION_VELOCITY_FACTOR = 0.5
+BARREL_GAP_DEPTH = 0.02
+
+# The power laws below are tabulated once on log-spaced grids and linearly
+# interpolated; 100 points per decade keep the error under 1e-4.
+REYNOLDS_GRID = np.logspace(0.0, 8.0, 801)
+TURBULENT_NUSSELT = 0.023 * REYNOLDS_GRID ** 0.8
+PRANDTL_GRID = np.logspace(-2.0, 4.0, 601)
+PRANDTL_FACTOR = PRANDTL_GRID ** 0.4
+VELOCITY_GRID = np.concatenate([[0.0], np.logspace(-3.0, 3.0, 601)])
+END_REGION_HTC = 15.0 + 6.75 * VELOCITY_GRID ** 0.65
+
+
+def passage_section(geometry, name):
+    """
+    Flow area (m^2) and hydraulic diameter (m) of a core passage.
+    """
+    if name.startswith('AirGap'):
+        gap = 2 * math.pi * geometry.stator_inner_radius * geometry.airgap
+        return gap + 0.5 * geometry.interpolar_area, 2 * geometry.airgap
+    if name.startswith('BtmIP'):
+        area = 0.5 * geometry.interpolar_area
+        return area, math.sqrt(4 * area / (math.pi * geometry.poles))
+    if name.startswith('BarrelGap'):
+        open_fraction = 1 - 0.5 * geometry.housing_contact_fraction
+        return 2 * math.pi * geometry.stator_outer_radius * BARREL_GAP_DEPTH * open_fraction, 2 * BARREL_GAP_DEPTH
+    return 2 * math.pi * geometry.stator_inner_radius * geometry.airgap, 2 * geometry.airgap
+
+
+def forced_convection(fluid, velocity, hydraulic_diameter, temperature=None):
+    """
+    Dittus-Boelter for turbulent duct flow, fully developed laminar otherwise.
+    With a ``temperature`` the conductivity and viscosity are evaluated there;
+    the mass flux, and so density x velocity, does not change along a passage.
+    """
+    if temperature is None:
+        conductivity, viscosity, specific_heat = fluid.conductivity, fluid.viscosity, fluid.specific_heat
+    else:
+        properties = fluid.properties(temperature)
+        conductivity, viscosity, specific_heat = properties.conductivity, properties.viscosity, \
+            properties.specific_heat
+    reynolds = fluid.density * velocity * hydraulic_diameter / viscosity
+    prandtl = viscosity * specific_heat / conductivity
+    return nusselt(reynolds, prandtl) * conductivity / hydraulic_diameter
+
+
+def nusselt(reynolds, prandtl):
+    turbulent = (np.interp(reynolds, REYNOLDS_GRID, TURBULENT_NUSSELT)
+                 * np.interp(prandtl, PRANDTL_GRID, PRANDTL_FACTOR))
+    return np.where(reynolds < TRANSITION_REYNOLDS, LAMINAR_NUSSELT, turbulent)
+
+
+def end_region(velocity):
+    """
+    Empirical end-winding coefficient as a function of local air velocity.
+    """
+    return np.interp(velocity, VELOCITY_GRID, END_REGION_HTC)
+
+
+def face_htc(calculation, geometry, fluid=None, velocity=0.0, hydraulic_diameter=None, swirl=False,
+             temperature=None):
+    """
+    Heat-transfer coefficient (W/(m^2 K)) of a face for its ``calculation`` type,
+    optionally at film ``temperature`` (array in, array out).
+    """
+    if calculation == 'EndRegion':
+        return end_region(max(velocity, END_REGION_VELOCITY_FACTOR * geometry.rotor_surface_speed))
+    if calculation == 'CFD':
+        if fluid is None or not hydraulic_diameter:
+            return NATURAL_CONVECTION
+        if swirl:
+            velocity = math.hypot(velocity, 0.5 * geometry.rotor_surface_speed)
+        return np.maximum(forced_convection(fluid, velocity, hydraulic_diameter, temperature), NATURAL_CONVECTION)
+    try:
+        return float(calculation)
+    except (TypeError, ValueError):
+        raise ThermalModelError('Unknown face calculation "%s"' % calculation)
+
+
+class FaceCoefficients(object):
+    """
+    Coefficients of every convective link of a network evaluated in one
+    call per fluid.  Only the CFD faces depend on the film temperature; the
+    EndRegion and fixed coefficients are worked out once.
+    """
+
+    def __init__(self, geometry, convection):
+        self.links = np.concatenate([np.arange(c.links.start, c.links.stop) for c in convection] or [np.zeros(0, np.int64)])
+        self.area = np.concatenate([c.area for c in convection] or [np.zeros(0)])
+        self.constant = np.empty(len(self.links))
+        self.fluids = {}
+        start = 0
+        for c in convection:
+            count = len(c.area)
+            rows = np.arange(start, start + count)
+            start += count
+            passage = c.passage
+            diameter = passage['hydraulic_diameter']
+            if c.calculation != 'CFD' or passage['fluid'] is None or not diameter:
+                self.constant[rows] = face_htc(c.calculation, geometry, passage['fluid'], passage['velocity'],
+                                               diameter, swirl=c.swirl)
+                continue
+            fluid = passage['fluid']
+            velocity = passage['velocity']
+            if c.swirl:
+                velocity = math.hypot(velocity, 0.5 * geometry.rotor_surface_speed)
+            self.constant[rows] = np.nan
+            entry = self.fluids.setdefault(fluid.name, (fluid, [], [], []))
+            entry[1].append(rows)
+            entry[2].append(np.full(count, fluid.density * velocity * diameter))
+            entry[3].append(np.full(count, diameter))
+        self.fluids = {name: (fluid, np.concatenate(rows), np.concatenate(flux), np.concatenate(diameter))
+                       for name, (fluid, rows, flux, diameter) in self.fluids.items()}
+
+    def htc(self, film_temperatures):
+        """
+        Coefficient of every link at ``film_temperatures`` (one per link).
+        """
+        h = self.constant.copy()
+        for fluid, rows, flux, diameter in self.fluids.values():
+            properties = fluid.properties(film_temperatures[rows])
+            prandtl = properties.viscosity * properties.specific_heat / properties.conductivity
+            h[rows] = np.maximum(nusselt(flux / properties.viscosity, prandtl) * properties.conductivity / diameter,
+                                 NATURAL_CONVECTION)
+        return h
@@ -0,0 +1,5 @@
+class ThermalModelError(ValueError):
+    """
+    Raised when a posted cooling model cannot be turned into a thermal network.
+    """
+
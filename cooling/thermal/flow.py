@@ -0,0 +1,325 @@
+"""
+Coolant flow graph of a model's ``passages``.
+
+Passages name their neighbours in ``in_passage`` / ``out_passage``
+(comma-separated, ``Ambient`` being the source and sink).  The graph is
+parsed once into upstream/downstream adjacency lists, ordered so every
+passage comes after all passages feeding it, and checked for conservation of
+flow at each junction.  A junction is a set of passages discharging into a
+common set of passages, e.g. 3.53 = 2.06 + 1.47 where one passage splits in
+two, or where several merge.
+
+When the model has a ``fan`` the entered flow rates are replaced by the split
+the fan actually drives: every junction is a pressure node, every passage a
+resistance ``dp = R Q + K Q |Q|`` and the fan, scaled to ``Operation.speed``
+by the affinity laws, lifts the plenum feeding the passages entered from
+Ambient.  The nodal equations are solved by Newton's method; their incidence
+structure is kept per topology so speed sweeps only redo the iterations.
+"""
+import math
+
+import numpy as np
+from scipy.sparse import bmat, coo_matrix
+from scipy.sparse.linalg import spsolve
+
+from cooling.thermal.cache import LRUCache
+from cooling.thermal.correlations import passage_section
+from cooling.thermal.exceptions import ThermalModelError
+from cooling.thermal.validation import model_entries
+
+AMBIENT = 'Ambient'
+
+# Relative imbalance tolerated at a junction, flow rates are entered rounded.
+CONSERVATION_TOLERANCE = 0.01
+
+# Darcy friction factor of the core passages and loss coefficients (in
+# dynamic heads) of their entry plus exit and of an end-region passage.
+FRICTION_FACTOR = 0.02
+CORE_MINOR_LOSS = 1.5
+END_REGION_LOSS = 1.0
+
+FLOW_TOLERANCE = 1e-9
+MAX_FLOW_ITERATIONS = 50
+
+# Incidence structure of the pressure-flow equations per passage topology.
+FLOW_TOPOLOGIES = LRUCache(maxsize=64)
+
+
+def _names(value):
+    if value is not None and not isinstance(value, str):
+        raise ThermalModelError('Passage connections must be comma-separated names')
+    return [name.strip() for name in (value or AMBIENT).split(',') if name.strip()]
+
+
+class FlowNetwork(object):
+    """
+    Directed graph of passages with their volumetric flow rates (m^3/s).
+    """
+
+    def __init__(self, entries):
+        self.flow_rates = {}
+        declared = {}
+        for entry in model_entries(entries, 'passages'):
+            name = entry.get('passage')
+            if not name or not isinstance(name, str):
+                raise ThermalModelError('Every passage needs a name')
+            if name in self.flow_rates:
+                raise ThermalModelError('Passage "%s" is defined twice' % name)
+            try:
+                self.flow_rates[name] = float(entry.get('flow_rate') or 0.0)
+            except (TypeError, ValueError):
+                raise ThermalModelError('Flow rate of passage "%s" must be a number' % name)
+            declared[name] = (_names(entry.get('in_passage')), _names(entry.get('out_passage')))
+
+        # an edge may be declared at either end
+        self.upstream = {name: [] for name in self.flow_rates}
+        self.downstream = {name: [] for name in self.flow_rates}
+        for name, (inlets, outlets) in declared.items():
+            for inlet in inlets:
+                self._edge(inlet, name)
+            for outlet in outlets:
+                self._edge(name, outlet)
+        self.order = self._topological_order()
+
+    def _edge(self, upstream, downstream):
+        for name in (upstream, downstream):
+            if name != AMBIENT and name not in self.flow_rates:
+                raise ThermalModelError('Unknown passage "%s"' % name)
+        if upstream == AMBIENT or downstream == AMBIENT:
+            return
+        if upstream not in self.upstream[downstream]:
+            self.upstream[downstream].append(upstream)
+            self.downstream[upstream].append(downstream)
+
+    def _topological_order(self):
+        waiting = {name: len(inlets) for name, inlets in self.upstream.items()}
+        ready = [name for name in self.flow_rates if not waiting[name]]
+        order = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for outlet in self.downstream[name]:
+                waiting[outlet] -= 1
+                if not waiting[outlet]:
+                    ready.append(outlet)
+        if len(order) < len(self.flow_rates):
+            loop = sorted(name for name in self.flow_rates if name not in order)
+            raise ThermalModelError('Passages %s form a closed loop; coolant must enter and leave through Ambient'
+                                    % ', '.join('"%s"' % name for name in loop))
+        return order
+
+    def junctions(self):
+        """
+        Yield ``(upstream, downstream)`` name lists of every internal junction.
+        """
+        seen = set()
+        for name in self.order:
+            if name in seen or not self.downstream[name]:
+                continue
+            upstream, downstream = {name}, set()
+            pending = [name]
+            while pending:
+                current = pending.pop()
+                for outlet in self.downstream[current]:
+                    if outlet not in downstream:
+                        downstream.add(outlet)
+                        pending.extend(p for p in self.upstream[outlet] if p not in upstream)
+                        upstream.update(self.upstream[outlet])
+            seen.update(upstream)
+            yield [p for p in self.order if p in upstream], [p for p in self.order if p in downstream]
+
+    def check_conservation(self, tolerance=CONSERVATION_TOLERANCE):
+        for upstream, downstream in self.junctions():
+            supplied = sum(self.flow_rates[name] for name in upstream)
+            drawn = sum(self.flow_rates[name] for name in downstream)
+            if abs(supplied - drawn) > tolerance * max(supplied, drawn, 1e-12):
+                raise ThermalModelError('Flow is not conserved from %s to %s: %s != %s' % (
+                    ', '.join('"%s"' % name for name in upstream),
+                    ', '.join('"%s"' % name for name in downstream),
+                    ' + '.join('%g' % self.flow_rates[name] for name in upstream),
+                    ' + '.join('%g' % self.flow_rates[name] for name in downstream)))
+
+    def branch_flows(self, name):
+        """
+        Flow rate entering ``name`` from each of its upstream passages.  At a
+        junction every upstream passage feeds the downstream ones in
+        proportion to their flow rates.
+        """
+        branches = {}
+        for inlet in self.upstream[name]:
+            drawn = sum(self.flow_rates[outlet] for outlet in self.downstream[inlet])
+            share = self.flow_rates[name] / drawn if drawn else 1.0 / len(self.downstream[inlet])
+            branches[inlet] = self.flow_rates[inlet] * share
+        return branches
+
+    def coolant_temperatures(self, heat, capacities, inlet_temperature):
+        """
+        Inlet and outlet temperature of every passage in one sweep along the
+        flow: each passage is entered at the mixed-mean outlet temperature
+        of its upstream passages (or ``inlet_temperature`` from Ambient) and
+        warms by ``heat / (flow rate x volumetric heat capacity)``.
+        """
+        inlets, outlets = {}, {}
+        for name in self.order:
+            branches = self.branch_flows(name)
+            supplied = sum(flow * capacities[inlet] for inlet, flow in branches.items())
+            if supplied > 0:
+                inlets[name] = sum(flow * capacities[inlet] * outlets[inlet]
+                                   for inlet, flow in branches.items()) / supplied
+            else:
+                inlets[name] = inlet_temperature
+            rate = self.flow_rates[name] * capacities[name]
+            outlets[name] = inlets[name] + (heat.get(name, 0.0) / rate if rate > 0 else 0.0)
+        return inlets, outlets
+
+
+def passage_resistance(geometry, name, fluid, entry):
+    """
+    ``(R, K)`` of ``dp = R Q + K Q |Q|`` for a passage: Hagen-Poiseuille
+    plus friction and minor losses for the core passages, one dynamic head
+    over the end-space annulus for the end regions.  ``entry['resistance']``
+    overrides ``K`` (Pa s^2/m^6).
+    """
+    if name.endswith('_Core'):
+        area, diameter = passage_section(geometry, name)
+        linear = 32 * fluid.viscosity * geometry.length / (diameter ** 2 * area)
+        quadratic = (FRICTION_FACTOR * geometry.length / diameter + CORE_MINOR_LOSS) * fluid.density / (2 * area ** 2)
+    else:
+        area = math.pi * (geometry.stator_outer_radius ** 2 - geometry.shaft_radius ** 2)
+        linear = 0.0
+        quadratic = END_REGION_LOSS * fluid.density / (2 * area ** 2)
+    if entry.get('resistance') is not None:
+        try:
+            quadratic = float(entry['resistance'])
+        except (TypeError, ValueError):
+            raise ThermalModelError('Resistance of passage "%s" must be a number' % name)
+        if quadratic <= 0:
+            raise ThermalModelError('Resistance of passage "%s" must be positive' % name)
+    return linear, quadratic
+
+
+class FanCurve(object):
+    """
+    Pressure rise against volumetric flow at ``rated_speed`` (rpm), given as
+    ``curve: [[flow, pressure], ...]`` with falling pressure.  At another
+    speed flow scales with the speed ratio and pressure with its square.
+    """
+
+    def __init__(self, entry, speed):
+        if not isinstance(entry, dict):
+            raise ThermalModelError('"fan" must be an object')
+        try:
+            points = np.array(entry.get('curve'), dtype=float)
+            rated_speed = float(entry.get('rated_speed') or speed)
+        except (TypeError, ValueError):
+            raise ThermalModelError('Fan "curve" must be a list of [flow, pressure] pairs')
+        if points.ndim != 2 or points.shape[1] != 2 or len(points) < 2:
+            raise ThermalModelError('Fan "curve" must be a list of at least two [flow, pressure] pairs')
+        if np.any(np.diff(points[:, 0]) <= 0) or np.any(np.diff(points[:, 1]) >= 0):
+            raise ThermalModelError('Fan "curve" pressure must fall as flow rises')
+        if rated_speed <= 0:
+            raise ThermalModelError('Fan "rated_speed" must be positive')
+        self.ratio = speed / rated_speed
+        self.flows = points[:, 0] * self.ratio
+        self.pressures = points[:, 1] * self.ratio ** 2
+
+    def pressure(self, flow):
+        """
+        Pressure rise and its slope at ``flow``, extrapolating the end
+        segments so Newton's method can overshoot the curve.
+        """
+        segment = min(max(np.searchsorted(self.flows, flow) - 1, 0), len(self.flows) - 2)
+        slope = (self.pressures[segment + 1] - self.pressures[segment]) / (self.flows[segment + 1] - self.flows[segment])
+        return self.pressures[segment] + slope * (flow - self.flows[segment]), slope
+
+
+def _flow_topology(flow):
+    """
+    Incidence matrix (pressure nodes x passages, -1 at the tail and +1 at
+    the head) of a flow graph.  Node 0 is the fan plenum; a head of -1 is
+    the Ambient outlet, where the pressure is zero.
+    """
+    key = tuple((name, tuple(flow.downstream[name])) for name in flow.order)
+    topology = FLOW_TOPOLOGIES.get(key)
+    if topology is not None:
+        return topology
+    tails = {name: 0 for name in flow.order}
+    heads = {name: -1 for name in flow.order}
+    for node, (upstream, downstream) in enumerate(flow.junctions(), start=1):
+        for name in upstream:
+            heads[name] = node
+        for name in downstream:
+            tails[name] = node
+    size = max(list(heads.values()) + [0]) + 1
+    rows, columns, values = [], [], []
+    for edge, name in enumerate(flow.order):
+        rows.append(tails[name])
+        columns.append(edge)
+        values.append(-1.0)
+        if heads[name] >= 0:
+            rows.append(heads[name])
+            columns.append(edge)
+            values.append(1.0)
+    incidence = coo_matrix((values, (rows, columns)), shape=(size, len(flow.order))).tocsr()
+    plenum = coo_matrix(([1.0], ([0], [0])), shape=(size, 1)).tocsr()
+    topology = (incidence, plenum)
+    FLOW_TOPOLOGIES.put(key, topology)
+    return topology
+
+
+def _passage_flow(drop, linear, quadratic, smallest):
+    """
+    Flow through ``dp = R Q + K Q |Q|`` for pressure drops ``drop`` and its
+    derivative, taken at no less than ``smallest`` flow so it stays finite
+    for purely quadratic passages at rest.
+    """
+    magnitude = np.abs(drop)
+    flow = 2 * magnitude / (linear + np.sqrt(linear ** 2 + 4 * quadratic * magnitude))
+    return np.sign(drop) * flow, 1.0 / (linear + 2 * quadratic * np.maximum(flow, smallest))
+
+
+def solve_flow_split(flow, resistances, fan):
+    """
+    Flow rates of every passage driven by ``fan`` through passages of
+    ``resistances`` (name -> ``(R, K)``), by damped Newton iteration on the
+    nodal mass balances plus the fan operating point.
+    """
+    incidence, plenum = _flow_topology(flow)
+    linear = np.array([resistances[name][0] for name in flow.order])
+    quadratic = np.array([resistances[name][1] for name in flow.order])
+    if fan.pressures[0] <= 0:
+        return {name: 0.0 for name in flow.order}
+    smallest = 1e-6 * fan.flows[-1]
+
+    def residual(pressures, fan_flow):
+        rates, slopes = _passage_flow(-incidence.T.dot(pressures), linear, quadratic, smallest)
+        lift, lift_slope = fan.pressure(fan_flow)
+        balance = incidence.dot(rates)
+        balance[0] += fan_flow
+        scaled = max(np.abs(balance).max() / fan.flows[-1], abs(pressures[0] - lift) / fan.pressures[0])
+        return np.append(balance, pressures[0] - lift), scaled, rates, slopes, lift_slope
+
+    # start from pressures falling evenly along the flow from half the shut-off pressure
+    size = incidence.shape[0]
+    pressures = 0.5 * fan.pressures[0] * (1.0 - np.arange(size) / size)
+    fan_flow = 0.5 * fan.flows[-1]
+    current, error, rates, slopes, lift_slope = residual(pressures, fan_flow)
+    for _ in range(MAX_FLOW_ITERATIONS):
+        if error < FLOW_TOLERANCE:
+            if rates.min() < 0:
+                raise ThermalModelError('The fan drives coolant backwards through passage "%s"'
+                                        % flow.order[int(rates.argmin())])
+            return dict(zip(flow.order, rates.tolist()))
+        conductance = incidence.dot(coo_matrix((slopes, (np.arange(len(slopes)),) * 2))).dot(incidence.T)
+        jacobian = bmat([[-conductance, plenum], [plenum.T, coo_matrix([[-lift_slope]])]]).tocsc()
+        step = spsolve(jacobian, -current)
+        damping = 1.0
+        while True:
+            trial = residual(pressures + damping * step[:-1], fan_flow + damping * step[-1])
+            if trial[1] < error or damping < 1e-3:
+                break
+            damping *= 0.5
+        pressures = pressures + damping * step[:-1]
+        fan_flow += damping * step[-1]
+        current, error, rates, slopes, lift_slope = trial
+    raise ThermalModelError('Fan flow split did not converge')
@@ -0,0 +1,125 @@
+"""
+Temperature-dependent coolant properties.
+
+Air and Water come with property tables at atmospheric pressure; a fluid in
+the model's ``fluids`` list may bring its own as ``properties`` with a
+``temperature`` column (degC) and any of ``density``, ``specific_heat``,
+``conductivity`` and ``viscosity``.  Values entered directly on the fluid are
+taken to hold at PROPERTY_TEMPERATURE and scale the table through that point,
+so a model that only overrides the conductivity keeps the tabulated
+variation.  Interpolated property arrays are cached per fluid and rounded
+temperature vector, since nonlinear iterations and batch cases keep asking
+for the same states.
+"""
+import hashlib
+import json
+from collections import namedtuple
+
+import numpy as np
+
+from cooling.thermal.cache import LRUCache
+from cooling.thermal.exceptions import ThermalModelError
+
+PROPERTY_TEMPERATURE = 20.0
+PROPERTIES = ('density', 'specific_heat', 'conductivity', 'viscosity')
+
+# Temperatures are rounded to this many decimals (degC) before lookup.
+ROUNDING = 2
+
+FluidProperties = namedtuple('FluidProperties', PROPERTIES)
+
+# degC; kg/m^3, J/(kg K), W/(m K), Pa s
+PROPERTY_TABLES = {
+    'Air': {
+        'temperature': [-20.0, 0.0, 20.0, 40.0, 60.0, 80.0, 100.0, 150.0, 200.0],
+        'density': [1.394, 1.292, 1.204, 1.127, 1.059, 0.9994, 0.9458, 0.8343, 0.7459],
+        'specific_heat': [1005.0, 1006.0, 1007.0, 1007.0, 1007.0, 1008.0, 1009.0, 1016.0, 1023.0],
+        'conductivity': [0.02211, 0.02364, 0.02514, 0.02662, 0.02808, 0.02953, 0.03095, 0.03429, 0.03779],
+        'viscosity': [1.630e-5, 1.729e-5, 1.825e-5, 1.918e-5, 2.008e-5, 2.096e-5, 2.181e-5, 2.38e-5, 2.57e-5],
+    },
+    'Water': {
+        'temperature': [0.0, 10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0, 80.0, 90.0, 100.0],
+        'density': [999.8, 999.7, 998.2, 995.6, 992.2, 988.0, 983.2, 977.7, 971.8, 965.3, 958.4],
+        'specific_heat': [4217.0, 4192.0, 4182.0, 4178.0, 4179.0, 4181.0, 4185.0, 4190.0, 4197.0, 4205.0, 4216.0],
+        'conductivity': [0.561, 0.580, 0.598, 0.615, 0.631, 0.643, 0.654, 0.663, 0.670, 0.675, 0.679],
+        'viscosity': [1.792e-3, 1.307e-3, 1.002e-3, 0.798e-3, 0.653e-3, 0.547e-3, 0.467e-3, 0.404e-3,
+                      0.355e-3, 0.315e-3, 0.282e-3],
+    },
+}
+
+PROPERTY_CACHE = LRUCache(maxsize=256)
+
+
+def _table(name, entry):
+    """
+    Temperature column and one column per property, all as float arrays.
+    """
+    table = entry.get('properties') or PROPERTY_TABLES.get(name) or {}
+    if not isinstance(table, dict):
+        raise ThermalModelError('Properties of fluid "%s" must be an object of columns' % name)
+    try:
+        temperature = np.asarray(table.get('temperature') or [PROPERTY_TEMPERATURE], dtype=float)
+        columns = {key: np.asarray(table[key], dtype=float) for key in PROPERTIES if table.get(key) is not None}
+    except (TypeError, ValueError):
+        raise ThermalModelError('Properties of fluid "%s" must be numbers' % name)
+    if temperature.ndim != 1 or np.any(np.diff(temperature) <= 0):
+        raise ThermalModelError('Property temperatures of fluid "%s" must be increasing' % name)
+    for key, column in columns.items():
+        if column.shape != temperature.shape or np.any(column <= 0):
+            raise ThermalModelError('Fluid "%s" needs one positive %s per temperature' % (name, key))
+    return temperature, columns
+
+
+class Fluid(object):
+    """
+    A coolant from the model's ``fluids`` list.  ``density``,
+    ``specific_heat``, ``conductivity`` and ``viscosity`` are the values at
+    PROPERTY_TEMPERATURE; ``properties`` gives them at other temperatures.
+    """
+
+    def __init__(self, entry):
+        self.name = entry.get('name')
+        self.temperatures, columns = _table(self.name, entry)
+        air = PROPERTY_TABLES['Air']
+        self.columns = {}
+        for key in PROPERTIES:
+            column = columns.get(key)
+            if column is None:
+                # not tabulated for this fluid; the Air value at PROPERTY_TEMPERATURE, constant
+                value = np.interp(PROPERTY_TEMPERATURE, air['temperature'], air[key])
+                column = np.full(len(self.temperatures), value)
+            value = entry.get(key)
+            if value is not None:
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    raise ThermalModelError('Fluid "%s" %s must be a number' % (self.name, key))
+                if value <= 0:
+                    raise ThermalModelError('Fluid "%s" %s must be positive' % (self.name, key))
+                column = column * value / np.interp(PROPERTY_TEMPERATURE, self.temperatures, column)
+            self.columns[key] = column
+            setattr(self, key, float(np.interp(PROPERTY_TEMPERATURE, self.temperatures, column)))
+        self.key = hashlib.sha1(json.dumps(
+            [self.name, self.temperatures.tolist()] + [self.columns[key].tolist() for key in PROPERTIES]
+        ).encode('utf-8')).hexdigest()
+
+    @property
+    def prandtl(self):
+        return self.viscosity * self.specific_heat / self.conductivity
+
+    def properties(self, temperature):
+        """
+        ``FluidProperties`` at ``temperature`` (degC, scalar or array),
+        held constant beyond the ends of the table.
+        """
+        temperature = np.round(np.asarray(temperature, dtype=float), ROUNDING)
+        key = (self.key, temperature.shape, temperature.tobytes())
+        properties = PROPERTY_CACHE.get(key)
+        if properties is None:
+            properties = FluidProperties(*(np.interp(temperature, self.temperatures, self.columns[name])
+                                           for name in PROPERTIES))
+            for column in properties:
+                if isinstance(column, np.ndarray):
+                    column.flags.writeable = False
+            PROPERTY_CACHE.put(key, properties)
+        return properties
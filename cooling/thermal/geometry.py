@@ -0,0 +1,211 @@
+"""
+Machine dimensions derived from the component parameters of a cooling model.
+
+All lengths are in metres except the conductor insulation thicknesses, which
+are entered in millimetres.  Parameters that are missing or physically
+impossible for the rest of the machine (e.g. a shaft wider than the bore)
+fall back to a default proportional to the stator bore; the ones that were
+given but replaced are listed in ``MachineGeometry.substituted``.
+"""
+import math
+from functools import partial
+
+import numpy as np
+
+from cooling.thermal.exceptions import ThermalModelError
+from cooling.thermal.validation import model_entries
+
+AMBIENT_TEMPERATURE = 40.0
+
+AXIAL_SLICES = 10
+ROTOR_RADIAL_NODES = 19
+ROTOR_TANGENTIAL_NODES = 9
+
+# Upper bound on the nodes of the slices (winding grids plus the stator,
+# housing and rotor core chains), checked before anything is allocated.
+MAX_NODES = 1000000
+CORE_CHAINS = 6
+
+POLE_ARC_RATIO = 0.7
+SLOT_LINER = 0.0005
+
+
+def component_parameters(components):
+    """
+    Map each active component type to its parameters dict.
+    """
+    parameters = {}
+    for component in model_entries(components, 'components'):
+        if not component or not component.get('active', True):
+            continue
+        parameters[component.get('type')] = component.get('parameters') or {}
+        if not isinstance(parameters[component.get('type')], dict):
+            raise ThermalModelError('Parameters of the %s component must be an object' % component.get('type'))
+    return parameters
+
+
+def _number(parameters, key, default):
+    value = parameters.get(key, default)
+    if value is None:
+        raise ThermalModelError('Parameter "%s" is required' % key)
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        value = math.nan
+    if not math.isfinite(value):
+        raise ThermalModelError('Parameter "%s" must be a number' % key)
+    return value
+
+
+def _substitute(parameters, key, value, default, substituted):
+    if substituted is not None and parameters.get(key) is not None:
+        substituted.append({'parameter': key, 'value': value, 'used': default})
+    return default
+
+
+def _dimension(parameters, key, default, upper=None, substituted=None):
+    value = _number(parameters, key, default)
+    if value <= 0 or (upper is not None and value >= upper):
+        if default is None:
+            raise ThermalModelError('Parameter "%s" is out of range' % key)
+        return _substitute(parameters, key, value, default, substituted)
+    return value
+
+
+def _count(parameters, key, default, minimum=1, substituted=None):
+    value = int(round(_number(parameters, key, default)))
+    return value if value >= minimum else _substitute(parameters, key, value, default, substituted)
+
+
+class MachineGeometry(object):
+    """
+    Dimensions of the machine described by the active components.
+    ``substituted`` lists every given parameter that was out of range, with
+    the value given and the default used in its place.
+    """
+
+    def __init__(self, components, mesh=None):
+        parameters = component_parameters(components)
+        for required in ('Stator', 'Rotor', 'Winding'):
+            if required not in parameters:
+                raise ThermalModelError('An active %s component is required' % required)
+        stator = parameters['Stator']
+        rotor = parameters['Rotor']
+        winding = parameters['Winding']
+        operation = parameters.get('Operation', {})
+        mesh = mesh or {}
+        if not isinstance(mesh, dict):
+            raise ThermalModelError('"mesh" must be an object')
+        self.substituted = []
+        dimension = partial(_dimension, substituted=self.substituted)
+        count = partial(_count, substituted=self.substituted)
+
+        # stator core
+        self.length = dimension(stator, 'core_length', None)
+        self.stator_outer_radius = dimension(stator, 'stator_outer_diameter', None) / 2
+        self.stator_inner_radius = dimension(stator, 'stator_inner_diameter', None,
+                                             upper=2 * self.stator_outer_radius) / 2
+        core_depth = self.stator_outer_radius - self.stator_inner_radius
+        self.slots = count(stator, 'slots', 36)
+        slot_pitch = 2 * math.pi * self.stator_inner_radius / self.slots
+        self.slot_depth = dimension(stator, 'slot_depth', 0.4 * core_depth, upper=core_depth)
+        self.slot_width = dimension(stator, 'slot_width', 0.5 * slot_pitch, upper=slot_pitch)
+        self.tooth_width = slot_pitch - self.slot_width
+        self.packing_factor = dimension(stator, 'stator_packing_factor', 0.95, upper=1.0 + 1e-9)
+        self.slot_bottom_radius = self.stator_inner_radius + self.slot_depth
+
+        # rotor
+        self.airgap = dimension(rotor, 'airgap', 0.01 * self.stator_inner_radius,
+                                upper=0.1 * self.stator_inner_radius)
+        self.rotor_outer_radius = self.stator_inner_radius - self.airgap
+        self.shaft_radius = dimension(rotor, 'shaft_diameter', 0.6 * self.rotor_outer_radius,
+                                      upper=1.2 * self.rotor_outer_radius) / 2
+        self.poles = count(rotor, 'poles', 4, minimum=2)
+        self.pole_tip_height = dimension(rotor, 'pole_tip_height', 0.05 * self.rotor_outer_radius,
+                                         upper=0.3 * self.rotor_outer_radius)
+        self.pole_arc = POLE_ARC_RATIO * 2 * math.pi * self.rotor_outer_radius / self.poles
+        self.pole_body_width = dimension(rotor, 'pole_body_width', 0.5 * self.pole_arc,
+                                         upper=self.pole_arc)
+        self.yoke_radius = self.shaft_radius + 0.5 * (self.rotor_outer_radius - self.shaft_radius) * 0.5
+        self.pole_body_height = self.rotor_outer_radius - self.pole_tip_height - self.yoke_radius
+
+        # stator winding, one grid node per radial conductor position in every slot
+        self.stator_conductor_width = dimension(winding, 'stator_conductor_width', 0.4 * self.slot_width,
+                                                upper=self.slot_width)
+        self.stator_conductor_depth = dimension(winding, 'stator_conductor_depth', 0.1 * self.slot_depth,
+                                                upper=self.slot_depth)
+        self.stator_insulation = dimension(winding, 'conductor_insulation', 0.1) * 1e-3
+        self.conductors_across_width = count(winding, 'conductors_across_width', 1)
+        self.stator_overhang = (
+            dimension(winding, 'stator_nde_axial_overhang', 0.3 * self.length, upper=self.length),
+            dimension(winding, 'statordeaxialoverhang', 0.3 * self.length, upper=self.length),
+        )
+        stator_radial = count(winding, 'conductors_per_turn', 10) * count(winding, 'stator_layers', 2)
+
+        # rotor winding: the "Magnet" component carries the field conductor data
+        magnet = parameters.get('Magnet')
+        self.has_rotor_winding = magnet is not None
+        magnet = magnet or {}
+        self.rotor_conductor_width = dimension(magnet, 'rotor_conductor_width', 0.005)
+        self.rotor_conductor_depth = dimension(magnet, 'rotor_conductor_depth', 0.005)
+        self.rotor_insulation = dimension(magnet, 'conductor_insulation_rotor', 0.25) * 1e-3
+        self.rotor_conductors_in_parallel = count(magnet, 'rotor_conductors_in_parallel', 1)
+        self.rotor_overhang = (
+            dimension(magnet, 'rotor_nde_axial_overhang', 0.1 * self.length, upper=self.length),
+            dimension(magnet, 'rotor_deaxial_overhang', 0.1 * self.length, upper=self.length),
+        )
+
+        # housing
+        housing = parameters.get('Housing')
+        self.has_housing = housing is not None
+        housing = housing or {}
+        self.housing_thickness = dimension(housing, 'housing_thickness', 0.03 * self.stator_outer_radius,
+                                           upper=0.5 * self.stator_outer_radius)
+        self.housing_outer_radius = self.stator_outer_radius + self.housing_thickness
+        circumference = 2 * math.pi * self.stator_outer_radius
+        self.housing_contact_fraction = min(
+            1.0, count(housing, 'landing_bars', 1) * dimension(housing, 'landing_bar_width', circumference)
+            / circumference)
+
+        # operating point
+        self.speed = max(_number(operation, 'speed', 0.0), 0.0)
+        self.angular_speed = self.speed * 2 * math.pi / 60
+        self.ambient_temperature = _number(operation, 'ambient_temperature', AMBIENT_TEMPERATURE)
+
+        # discretisation
+        self.axial_slices = count(mesh, 'axial_slices', AXIAL_SLICES)
+        self.stator_grid = (self.axial_slices,
+                            count(mesh, 'stator_radial', stator_radial),
+                            count(mesh, 'stator_tangential', 1))
+        self.rotor_grid = (self.axial_slices,
+                           count(mesh, 'rotor_radial', ROTOR_RADIAL_NODES),
+                           count(mesh, 'rotor_tangential', ROTOR_TANGENTIAL_NODES))
+        per_slice = CORE_CHAINS + self.stator_grid[1] * self.stator_grid[2]
+        if self.has_rotor_winding:
+            per_slice += self.rotor_grid[1] * self.rotor_grid[2]
+        if self.axial_slices * per_slice > MAX_NODES:
+            raise ThermalModelError('The mesh has %d nodes; at most %d are allowed'
+                                    % (self.axial_slices * per_slice, MAX_NODES))
+        self.slice_length = self.length / self.axial_slices
+        self.axial_coordinates = (np.arange(self.axial_slices) + 0.5) * self.slice_length
+
+    @property
+    def rotor_surface_speed(self):
+        return self.angular_speed * self.rotor_outer_radius
+
+    @property
+    def end_space_volume(self):
+        """
+        Air volume of one end region, between shaft and stator outer diameter.
+        """
+        overhang = max(self.stator_overhang)
+        return 0.5 * math.pi * (self.stator_outer_radius ** 2 - self.shaft_radius ** 2) * overhang
+
+    @property
+    def interpolar_area(self):
+        """
+        Axial flow area between neighbouring poles, below the pole shoes.
+        """
+        annulus = math.pi * (self.rotor_outer_radius - self.pole_tip_height) ** 2 - math.pi * self.yoke_radius ** 2
+        bodies = self.poles * self.pole_body_width * self.pole_body_height
+        return max(annulus - bodies, 0.05 * annulus)
@@ -0,0 +1,509 @@
+"""
+Lumped-parameter thermal network built from a posted cooling model.
+
+Solid nodes are named ``<group>_<index>`` where the group matches the
+``<name>_<region>`` of the loss entries that heat it, e.g. ``Tooth_Core_3``
+or ``StatorWinding_Core_3_12_0``.  Every winding grid node stands for the same
+conductor position in all slots (or poles) at once, so the network covers the
+whole machine while only one slot is meshed.
+"""
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from cooling.thermal.correlations import face_htc, passage_section
+from cooling.thermal.exceptions import ThermalModelError
+from cooling.thermal.flow import FanCurve, FlowNetwork, passage_resistance, solve_flow_split
+from cooling.thermal.fluids import Fluid
+from cooling.thermal.geometry import MachineGeometry, SLOT_LINER
+from cooling.thermal.validation import model_entries
+
+K_COPPER = 385.0
+K_INSULATION = 0.2
+K_LAMINATION = 28.0
+K_LAMINATION_AXIAL = 2.0
+K_ROTOR_STEEL = 40.0
+K_HOUSING = 45.0
+H_CONTACT = 500.0
+
+# volumetric heat capacity, density x specific heat (J/(m^3 K))
+C_COPPER = 8933.0 * 385.0
+C_LAMINATION = 7650.0 * 460.0
+C_STEEL = 7850.0 * 460.0
+
+AMBIENT = 'Ambient'
+ENDS = ('NDE', 'DE')
+
+WindingGrid = namedtuple('WindingGrid', ['name', 'shape', 'axial_coordinates', 'indices'])
+
+# Links of one face to one passage, kept so their coefficients can be
+# re-evaluated at the current film temperature.
+ConvectiveLinks = namedtuple('ConvectiveLinks', ['links', 'area', 'calculation', 'passage', 'swirl'])
+
+# Component reported to the frontend -> node groups it is made of.
+COMPONENT_GROUPS = (
+    ('Stator', ('BackIron_Core', 'Tooth_Core')),
+    ('Housing', ('Housing_Core',)),
+    ('Rotor', ('PoleBody_Core', 'ShoeMid-Leading_Core', 'PoleTip-Leading_Core')),
+    ('Winding', ('StatorWinding_Core', 'StatorWinding_EW-NDE-Stator', 'StatorWinding_EW-DE-Stator')),
+    ('Magnet', ('RotorWinding-Leading_Core', 'RotorWinding-Leading_EW-NDE-Stator',
+                'RotorWinding-Leading_EW-DE-Stator')),
+)
+
+# Fluid a face with passage "None" exchanges heat with, per machine end.
+FACE_DEFAULT_PASSAGES = {
+    'RotorFace': 'OH_RotorFluid_EW-{end}-Rotor',
+    'RotorSideEW': 'OH_RotorFluid_EW-{end}-Rotor',
+    'RotorTopEW': 'OH_RotorFluid_EW-{end}-Rotor',
+    'RotorGapEW': 'OH_RotorFluid_EW-{end}-Rotor',
+    'StatorWindingGapEW': 'OH_StatorFluid_EW-{end}-Stator',
+    'StatorOuterEW': 'OH_StatorFluid_EW-{end}-Stator',
+    'StatorInnerEW': 'OH_StatorFluid_EW-{end}-Stator',
+}
+
+# Faces whose coolant is dragged round by the rotor.
+SWIRL_FACES = ('AirGapRotor', 'AirGapStator', 'TopIP', 'BtmIP')
+
+
+def _slab(conductivity, area, thickness):
+    return conductivity * area / thickness
+
+
+def _series(*resistances):
+    return 1.0 / sum(resistances)
+
+
+def _neighbours(grid, axis):
+    """
+    Index arrays of every grid node and its successor along ``axis``.
+    """
+    lower = [slice(None)] * grid.ndim
+    upper = [slice(None)] * grid.ndim
+    lower[axis] = slice(None, -1)
+    upper[axis] = slice(1, None)
+    return grid[tuple(lower)], grid[tuple(upper)]
+
+
+def _stack(chunks, dtype):
+    if not chunks:
+        return np.zeros(0, dtype=dtype)
+    return np.concatenate(chunks).astype(dtype, copy=False)
+
+
+class ThermalNetwork(object):
+    """
+    Nodes, conductive links, coolant flows and ambient boundary links.
+
+    Links are collected as chunks of index/conductance arrays so whole grid
+    faces can be connected in one call; ``*_arrays`` flattens them.
+    """
+
+    def __init__(self, geometry):
+        self.geometry = geometry
+        self.names = []
+        self.volumes = []
+        self.capacities = []
+        self.groups = {}
+        self.grids = []
+        self.copper = []
+        self.convection = []
+        self.link_count = 0
+        self.links = ([], [], [])
+        self.ambient_links = ([], [])
+        self.flows = ([], [], [])
+        self.flow = None
+        self.passages = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def add_node(self, name, volume=0.0, group=None, heat_capacity=0.0):
+        """
+        ``heat_capacity`` is per unit volume; the node stores volume x heat_capacity (J/K).
+        """
+        index = len(self.names)
+        self.names.append(name)
+        self.volumes.append(volume)
+        self.capacities.append(volume * heat_capacity)
+        self.groups.setdefault(group or name, []).append(index)
+        return index
+
+    def _add_block(self, group, names, volume, heat_capacity):
+        start = len(self.names)
+        self.names.extend(names)
+        self.volumes.extend([volume] * len(names))
+        self.capacities.extend([volume * heat_capacity] * len(names))
+        indices = np.arange(start, len(self.names))
+        self.groups.setdefault(group, []).extend(indices.tolist())
+        return indices
+
+    def add_chain(self, group, count, volume, heat_capacity):
+        """
+        ``count`` axial nodes ``<group>_0 .. <group>_<count-1>``.
+        """
+        return self._add_block(group, ['%s_%d' % (group, a) for a in range(count)], volume, heat_capacity)
+
+    def add_grid(self, group, shape, volume, heat_capacity, axial_coordinates):
+        """
+        Structured (axial, radial, tangential) winding grid, numbered
+        contiguously in C order so ``indices[a, r, t]`` is a plain reshape.
+        """
+        a, r, t = np.indices(shape).reshape(3, -1).tolist()
+        names = ['%s_%d_%d_%d' % (group, i, j, k) for i, j, k in zip(a, r, t)]
+        indices = self._add_block(group, names, volume, heat_capacity).reshape(shape)
+        self.grids.append(WindingGrid(group, shape, axial_coordinates, indices))
+        return indices
+
+    def connect(self, i, j, conductance):
+        """
+        Link node(s) ``i`` to ``j``; arrays of indices and conductances broadcast.
+        Returns the slice of the new links in ``link_arrays()``.
+        """
+        i, j, conductance = np.broadcast_arrays(i, j, conductance)
+        self.links[0].append(i.ravel())
+        self.links[1].append(j.ravel())
+        self.links[2].append(conductance.ravel())
+        start = self.link_count
+        self.link_count += i.size
+        return slice(start, self.link_count)
+
+    def connect_ambient(self, i, conductance):
+        i, conductance = np.broadcast_arrays(i, conductance)
+        self.ambient_links[0].append(i.ravel())
+        self.ambient_links[1].append(conductance.ravel())
+
+    def add_flow(self, upstream, downstream, capacity_rate):
+        """
+        Coolant carried from ``upstream`` (or ambient when ``None``) into
+        ``downstream`` at ``capacity_rate`` = mass flow x specific heat (W/K).
+        """
+        upstream, downstream, capacity_rate = np.broadcast_arrays(
+            -1 if upstream is None else upstream, downstream, capacity_rate)
+        self.flows[0].append(upstream.ravel())
+        self.flows[1].append(downstream.ravel())
+        self.flows[2].append(capacity_rate.ravel())
+
+    def link_arrays(self):
+        return tuple(_stack(chunks, dtype) for chunks, dtype in zip(self.links, (np.int64, np.int64, float)))
+
+    def ambient_arrays(self):
+        return tuple(_stack(chunks, dtype) for chunks, dtype in zip(self.ambient_links, (np.int64, float)))
+
+    def flow_arrays(self):
+        return tuple(_stack(chunks, dtype) for chunks, dtype in zip(self.flows, (np.int64, np.int64, float)))
+
+    def loss_vector(self, losses):
+        """
+        Heat input per node, each loss spread over its group by node volume.
+        """
+        heat = np.zeros(len(self))
+        volumes = np.asarray(self.volumes)
+        for entry in model_entries(losses, 'losses'):
+            group = '%s_%s' % (entry.get('name'), entry.get('region'))
+            if group not in self.groups:
+                raise ThermalModelError('No thermal node matches loss "%s"' % group)
+            try:
+                loss = float(entry.get('loss') or 0.0)
+            except (TypeError, ValueError):
+                raise ThermalModelError('Loss "%s" must be a number' % group)
+            nodes = self.groups[group]
+            weights = volumes[nodes]
+            total = weights.sum()
+            heat[nodes] += loss * (weights / total if total > 0 else 1.0 / len(nodes))
+        return heat
+
+
+class NetworkBuilder(object):
+    """
+    Turns the components, faces, passages and fluids of a model into a
+    ``ThermalNetwork``.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.geometry = MachineGeometry(model.get('components'), model.get('mesh'))
+        self.network = ThermalNetwork(self.geometry)
+        self.fluids = {entry.get('name'): Fluid(entry) for entry in model_entries(model.get('fluids'), 'fluids')}
+        self.passages = {}
+
+    def build(self):
+        self._stator()
+        self._housing()
+        self._rotor()
+        # winding grids are reported in build order: rotor, then stator
+        if self.geometry.has_rotor_winding:
+            self._rotor_winding()
+        self._stator_winding()
+        self._passages()
+        self._faces()
+        return self.network
+
+    # solids
+
+    def _stator(self):
+        geo = self.geometry
+        n, dz = geo.axial_slices, geo.slice_length
+        tooth_area = (math.pi * (geo.slot_bottom_radius ** 2 - geo.stator_inner_radius ** 2)
+                      - geo.slots * geo.slot_width * geo.slot_depth) * geo.packing_factor
+        back_area = math.pi * (geo.stator_outer_radius ** 2 - geo.slot_bottom_radius ** 2) * geo.packing_factor
+        self.tooth = self.network.add_chain('Tooth_Core', n, tooth_area * dz, C_LAMINATION)
+        self.back_iron = self.network.add_chain('BackIron_Core', n, back_area * dz, C_LAMINATION)
+
+        radial = _slab(K_LAMINATION, 2 * math.pi * geo.slot_bottom_radius * dz * geo.packing_factor,
+                       0.5 * (geo.stator_outer_radius - geo.stator_inner_radius))
+        self.network.connect(self.tooth, self.back_iron, radial)
+        self._axial(self.tooth, _slab(K_LAMINATION_AXIAL, tooth_area, dz))
+        self._axial(self.back_iron, _slab(K_LAMINATION_AXIAL, back_area, dz))
+
+    def _housing(self):
+        geo = self.geometry
+        if not geo.has_housing:
+            self.housing = None
+            return
+        n, dz = geo.axial_slices, geo.slice_length
+        area = math.pi * (geo.housing_outer_radius ** 2 - geo.stator_outer_radius ** 2)
+        self.housing = self.network.add_chain('Housing_Core', n, area * dz, C_STEEL)
+        contact = H_CONTACT * 2 * math.pi * geo.stator_outer_radius * dz * geo.housing_contact_fraction
+        self.network.connect(self.back_iron, self.housing, contact)
+        self._axial(self.housing, _slab(K_HOUSING, area, dz))
+
+    def _rotor(self):
+        geo = self.geometry
+        n, dz = geo.axial_slices, geo.slice_length
+        body_area = (math.pi * (geo.yoke_radius ** 2 - geo.shaft_radius ** 2)
+                     + geo.poles * geo.pole_body_width * geo.pole_body_height)
+        shoe_area = geo.poles * 0.5 * geo.pole_arc * geo.pole_tip_height
+        self.pole_body = self.network.add_chain('PoleBody_Core', n, body_area * dz, C_STEEL)
+        self.shoe_mid = self.network.add_chain('ShoeMid-Leading_Core', n, shoe_area * dz, C_STEEL)
+        self.pole_tip = self.network.add_chain('PoleTip-Leading_Core', n, shoe_area * dz, C_STEEL)
+
+        body_shoe = _slab(K_ROTOR_STEEL, geo.poles * geo.pole_body_width * dz,
+                          0.5 * (geo.pole_body_height + geo.pole_tip_height))
+        shoe_tip = _slab(K_ROTOR_STEEL, geo.poles * geo.pole_tip_height * dz, 0.25 * geo.pole_arc)
+        self.network.connect(self.pole_body, self.shoe_mid, body_shoe)
+        self.network.connect(self.shoe_mid, self.pole_tip, shoe_tip)
+        self._axial(self.pole_body, _slab(K_ROTOR_STEEL, body_area, dz))
+        self._axial(self.shoe_mid, _slab(K_ROTOR_STEEL, shoe_area, dz))
+        self._axial(self.pole_tip, _slab(K_ROTOR_STEEL, shoe_area, dz))
+
+    def _axial(self, chain, conductance):
+        self.network.connect(chain[:-1], chain[1:], conductance)
+
+    # windings
+
+    def _winding_grid(self, group, shape, parallel, width, depth, insulation, overhang, end_group):
+        """
+        Conductor grid plus one lumped end-winding node per machine end.
+        ``width`` x ``depth`` is the copper section of one node in one slot.
+        """
+        geo = self.geometry
+        dz = geo.slice_length
+        copper = parallel * width * depth
+        grid = self.network.add_grid(group, shape, copper * dz, C_COPPER, geo.axial_coordinates)
+
+        radial = parallel * width * dz / (depth / K_COPPER + 2 * insulation / K_INSULATION)
+        tangential = parallel * depth * dz / (width / K_COPPER + 2 * insulation / K_INSULATION)
+        axial = _slab(K_COPPER, copper, dz)
+        self.network.connect(*_neighbours(grid, 0), axial)
+        self.network.connect(*_neighbours(grid, 1), radial)
+        self.network.connect(*_neighbours(grid, 2), tangential)
+
+        n_a, n_r, n_t = shape
+        ends = []
+        for end, length, face in zip(ENDS, overhang, (0, n_a - 1)):
+            end_node = self.network.add_node('%s_EW-%s-Stator' % (end_group, end), copper * n_r * n_t * 2 * length,
+                                             heat_capacity=C_COPPER)
+            self.network.connect(grid[face], end_node, _slab(K_COPPER, copper, 0.5 * (dz + length)))
+            ends.append(end_node)
+        self.network.copper.extend(grid.ravel().tolist() + ends)
+        return grid, ends
+
+    def _wall(self, parallel, area, insulation, half_copper, half_steel=0.0, k_steel=K_LAMINATION):
+        """
+        Conductor -> insulation -> slot liner -> iron.
+        """
+        return parallel * area * _series(insulation / K_INSULATION, SLOT_LINER / K_INSULATION,
+                                         half_copper / K_COPPER, half_steel / k_steel)
+
+    def _stator_winding(self):
+        geo = self.geometry
+        dz = geo.slice_length
+        shape = geo.stator_grid
+        n_t = shape[2]
+        width = geo.conductors_across_width * geo.stator_conductor_width / n_t
+        depth = geo.stator_conductor_depth
+        grid, self.stator_end_windings = self._winding_grid(
+            'StatorWinding_Core', shape, geo.slots, width, depth, geo.stator_insulation,
+            geo.stator_overhang, 'StatorWinding')
+
+        side = self._wall(geo.slots, depth * dz, geo.stator_insulation, 0.5 * width, 0.25 * geo.tooth_width)
+        top_bottom = self._wall(geo.slots, width * dz, geo.stator_insulation, 0.5 * depth)
+        tooth = self.tooth[:, None]
+        self.network.connect(grid[:, :, 0], tooth, side)
+        self.network.connect(grid[:, :, -1], tooth, side)
+        self.network.connect(grid[:, 0, :], tooth, top_bottom)
+        self.network.connect(grid[:, -1, :], self.back_iron[:, None], top_bottom)
+        self.stator_grid = grid
+
+    def _rotor_winding(self):
+        geo = self.geometry
+        dz = geo.slice_length
+        shape = geo.rotor_grid
+        n_r = shape[1]
+        parallel = geo.poles * geo.rotor_conductors_in_parallel
+        width = geo.rotor_conductor_width
+        depth = geo.rotor_conductor_depth
+        grid, self.rotor_end_windings = self._winding_grid(
+            'RotorWinding-Leading_Core', shape, parallel, width, depth, geo.rotor_insulation,
+            geo.rotor_overhang, 'RotorWinding-Leading')
+
+        side = self._wall(parallel, depth * dz, geo.rotor_insulation, 0.5 * width)
+        bottom_top = self._wall(parallel, width * dz, geo.rotor_insulation, 0.5 * depth)
+        pole_body = self.pole_body[:, None]
+        self.network.connect(grid[:, :, 0], pole_body, side)
+        self.network.connect(grid[:, 0, :], pole_body, bottom_top)
+        self.network.connect(grid[:, -1, :], self.shoe_mid[:, None], bottom_top)
+        end_contact = self._wall(parallel, n_r * depth * geo.pole_body_width, geo.rotor_insulation, 0.5 * width)
+        for end_node, body in zip(self.rotor_end_windings, (self.pole_body[0], self.pole_body[-1])):
+            self.network.connect(end_node, body, end_contact)
+        self.rotor_grid = grid
+
+    # coolant
+
+    def _passages(self):
+        """
+        One fluid node per end-region passage and one per axial slice for the
+        ``_Core`` passages, which are entered at the non-drive end (slice 0).
+        Passages are numbered in flow order, so every coolant node follows
+        the nodes feeding it.
+        """
+        geo = self.geometry
+        entries = model_entries(self.model.get('passages'), 'passages')
+        flow = FlowNetwork(entries)
+        fluids, resistances = {}, {}
+        for entry in entries:
+            name = entry['passage']
+            fluids[name] = self.fluids.get(entry.get('fluid'))
+            if fluids[name] is None:
+                raise ThermalModelError('Passage "%s" uses unknown fluid "%s"' % (name, entry.get('fluid')))
+            resistances[name] = passage_resistance(geo, name, fluids[name], entry)
+        if self.model.get('fan') is not None:
+            flow.flow_rates.update(solve_flow_split(flow, resistances, FanCurve(self.model['fan'], geo.speed)))
+        else:
+            flow.check_conservation()
+        for name in flow.order:
+            fluid = fluids[name]
+            flow_rate = flow.flow_rates[name]
+            heat_capacity = fluid.density * fluid.specific_heat
+            if name.endswith('_Core'):
+                area, diameter = passage_section(geo, name)
+                nodes = self.network.add_chain(name, geo.axial_slices, area * geo.slice_length, heat_capacity)
+            else:
+                nodes = np.array([self.network.add_node(name, geo.end_space_volume, heat_capacity=heat_capacity)])
+                area, diameter = None, None
+            self.passages[name] = {
+                'nodes': nodes, 'fluid': fluid, 'flow_rate': flow_rate,
+                'velocity': flow_rate / area if area else 0.0, 'hydraulic_diameter': diameter,
+            }
+
+            branches = flow.branch_flows(name)
+            if not branches:
+                self.network.add_flow(None, nodes[0], heat_capacity * flow_rate)
+            for inlet, branch_rate in branches.items():
+                upstream = self.passages[inlet]
+                self.network.add_flow(upstream['nodes'][-1], nodes[0],
+                                      upstream['fluid'].density * upstream['fluid'].specific_heat * branch_rate)
+            self.network.add_flow(nodes[:-1], nodes[1:], heat_capacity * flow_rate)
+        self.network.flow = flow
+        self.network.passages = self.passages
+
+    # convection
+
+    def _face_surfaces(self, name):
+        """
+        (solid nodes, area per node, slice indices or machine end) wetted by a face.
+        """
+        geo = self.geometry
+        n, dz = geo.axial_slices, geo.slice_length
+        slices = np.arange(n)
+        surfaces = []
+        if name == 'BarrelGap':
+            outer = 2 * math.pi * geo.stator_outer_radius * dz
+            surfaces.append((self.back_iron, outer, slices))
+            if self.housing is not None:
+                surfaces.append((self.housing, outer, slices))
+        elif name == 'AirGapRotor':
+            area = 0.5 * geo.poles * geo.pole_arc * dz
+            surfaces += [(self.pole_tip, area, slices), (self.shoe_mid, area, slices)]
+        elif name == 'AirGapStator':
+            surfaces.append((self.tooth, geo.slots * geo.tooth_width * dz, slices))
+        elif name == 'TopIP' and geo.has_rotor_winding:
+            area = geo.poles * geo.rotor_conductors_in_parallel * geo.rotor_conductor_depth * dz
+            surfaces.append((self.rotor_grid[:, :, -1], area, slices[:, None]))
+        elif name == 'BtmIP':
+            area = (2 * math.pi * geo.yoke_radius - geo.poles * geo.pole_body_width) * dz
+            surfaces.append((self.pole_body, area, slices))
+        elif name == 'RotorFace':
+            area = math.pi * (geo.yoke_radius ** 2 - geo.shaft_radius ** 2)
+            surfaces += [(self.pole_body[0], area, 'NDE'), (self.pole_body[-1], area, 'DE')]
+        elif name == 'Shaft':
+            surfaces.append((self.pole_body, 2 * math.pi * geo.shaft_radius * dz, slices))
+        elif name == 'Housing' and self.housing is not None:
+            surfaces.append((self.housing, 2 * math.pi * geo.housing_outer_radius * dz, slices))
+        elif name in ('RotorSideEW', 'RotorTopEW', 'RotorGapEW') and geo.has_rotor_winding:
+            n_a, n_r, n_t = geo.rotor_grid
+            height = n_r * (geo.rotor_conductor_depth + 2 * geo.rotor_insulation)
+            width = n_t * (geo.rotor_conductor_width + 2 * geo.rotor_insulation)
+            turn = geo.pole_body_width + 2 * width
+            span = {'RotorSideEW': height, 'RotorGapEW': height, 'RotorTopEW': width}[name]
+            for end, end_node, length in zip(ENDS, self.rotor_end_windings, geo.rotor_overhang):
+                surfaces.append((end_node, geo.poles * span * (turn + length), end))
+        elif name in ('StatorWindingGapEW', 'StatorOuterEW', 'StatorInnerEW'):
+            radius = {'StatorOuterEW': geo.slot_bottom_radius, 'StatorInnerEW': geo.stator_inner_radius}
+            for end, end_node, length in zip(ENDS, self.stator_end_windings, geo.stator_overhang):
+                if name == 'StatorWindingGapEW':
+                    area = geo.slots * geo.slot_depth * length
+                else:
+                    area = 2 * math.pi * radius[name] * length
+                surfaces.append((end_node, area, end))
+        return surfaces
+
+    def _fluid_nodes(self, passage, position):
+        nodes = passage['nodes']
+        if len(nodes) == 1:
+            return nodes[0]
+        if isinstance(position, str):
+            return nodes[0] if position == 'NDE' else nodes[-1]
+        return nodes[position]
+
+    def _faces(self):
+        for face in model_entries(self.model.get('faces'), 'faces'):
+            name = face.get('name')
+            requested = face.get('passage')
+            for nodes, area, position in self._face_surfaces(name):
+                if requested and requested != 'None':
+                    passage_name = requested
+                    if passage_name not in self.passages:
+                        raise ThermalModelError('Face "%s" refers to unknown passage "%s"' % (name, requested))
+                else:
+                    template = FACE_DEFAULT_PASSAGES.get(name)
+                    end = position if isinstance(position, str) else None
+                    passage_name = template.format(end=end) if template and end else AMBIENT
+                passage = self.passages.get(passage_name)
+                if passage is None:
+                    h = face_htc(face.get('calculation'), self.geometry)
+                    self.network.connect_ambient(nodes, h * area)
+                    continue
+                swirl = name in SWIRL_FACES
+                h = face_htc(face.get('calculation'), self.geometry, passage['fluid'], passage['velocity'],
+                             passage['hydraulic_diameter'], swirl=swirl)
+                fluid_nodes = self._fluid_nodes(passage, position)
+                links = self.network.connect(nodes, fluid_nodes, h * area)
+                self.network.convection.append(ConvectiveLinks(
+                    links, np.broadcast_to(area, np.broadcast(nodes, fluid_nodes).shape).ravel(),
+                    face.get('calculation'), passage, swirl))
+
+
+def build_network(model):
+    return NetworkBuilder(model).build()
@@ -0,0 +1,105 @@
+"""
+Steady state with temperature-dependent copper losses and coolant properties.
+
+Copper losses grow linearly with temperature, ``P = P0 (1 + alpha (T - Tref))``,
+so their Newton linearisation is exact and goes straight into the matrix
+diagonal.  The convective coefficients depend on the coolant conductivity and
+viscosity at the film temperature; they are updated by Picard iteration,
+under-relaxing the conductances rather than the temperatures so the exact
+copper term is not damped.  The converged field of each geometry is kept and
+used as the starting point of the next solve, so re-solves after small loss
+changes only need a couple of iterations.
+"""
+import numpy as np
+from scipy.sparse import diags
+
+from cooling.thermal.cache import LRUCache, geometry_fingerprint
+from cooling.thermal.correlations import FaceCoefficients
+from cooling.thermal.exceptions import ThermalModelError
+from cooling.thermal.solver import assemble, factorise, model_results, steady_state
+
+COPPER_TEMPERATURE_COEFFICIENT = 0.00393
+REFERENCE_TEMPERATURE = 20.0
+TOLERANCE = 0.01
+RELAXATION = 0.9
+MAX_ITERATIONS = 50
+
+# Bytes of converged temperature fields kept as starting points.
+WARM_STARTS = LRUCache(maxsize=64 * 1024 * 1024)
+
+
+def _option(options, key, default):
+    try:
+        value = float(options.get(key, default))
+    except (TypeError, ValueError):
+        value = np.nan
+    if not np.isfinite(value):
+        raise ThermalModelError('Nonlinear option "%s" must be a number' % key)
+    return value
+
+
+def convective_conductances(coefficients, i, j, temperatures):
+    """
+    Conductances of the convective links with every face coefficient
+    evaluated at the film temperature of its links.
+    """
+    links = coefficients.links
+    return coefficients.htc(0.5 * (temperatures[i[links]] + temperatures[j[links]])) * coefficients.area
+
+
+def solve_nonlinear(model, options=None):
+    """
+    Iterate losses and coolant properties to convergence.  Returns the node
+    temperatures and the number of iterations used.
+    """
+    options = options if isinstance(options, dict) else {}
+    tolerance = _option(options, 'tolerance', TOLERANCE)
+    relaxation = min(max(_option(options, 'relaxation', RELAXATION), 0.05), 1.0)
+    max_iterations = _option(options, 'max_iterations', MAX_ITERATIONS)
+    if max_iterations < 1 or max_iterations != int(max_iterations):
+        raise ThermalModelError('Nonlinear option "max_iterations" must be a positive whole number')
+    max_iterations = int(max_iterations)
+    reference = _option(options, 'reference_temperature', REFERENCE_TEMPERATURE)
+
+    state = steady_state(model)
+    network = state.network
+    ambient_temperature = network.geometry.ambient_temperature
+    heat = network.loss_vector(model.get('losses'))
+    copper = np.zeros(len(network), dtype=bool)
+    copper[network.copper] = True
+    resistive = COPPER_TEMPERATURE_COEFFICIENT * heat * copper
+    rhs = heat - resistive * reference + state.ambient * ambient_temperature
+
+    key = geometry_fingerprint(model)
+    temperatures = WARM_STARTS.get(key)
+    if temperatures is None:
+        temperatures = state.solve(model.get('losses'))
+
+    coefficients = FaceCoefficients(network.geometry, network.convection)
+    links = coefficients.links
+    i, j, conductances = network.link_arrays()
+    conductances[links] = convective_conductances(coefficients, i, j, temperatures)
+    for iteration in range(1, max_iterations + 1):
+        matrix, _ = assemble(network, conductances)
+        try:
+            factor = factorise(matrix - diags(resistive), network, state.iterative)
+        except RuntimeError:
+            raise ThermalModelError('Winding losses run away thermally; no steady state exists')
+        updated = factor.solve(rhs)
+        change = np.abs(updated - temperatures).max()
+        temperatures = updated
+        if change < tolerance:
+            break
+        updated = convective_conductances(coefficients, i, j, temperatures)
+        conductances[links] += relaxation * (updated - conductances[links])
+    else:
+        raise ThermalModelError('Nonlinear solve did not converge in %d iterations' % max_iterations)
+
+    WARM_STARTS.put(key, temperatures, size=temperatures.nbytes)
+    return temperatures, iteration
+
+
+def solve_model_nonlinear(model, options=None, columnar=False):
+    temperatures, iterations = solve_nonlinear(model, options)
+    network = steady_state(model).network
+    return dict(model_results(network, temperatures, columnar), iterations=iterations)
@@ -0,0 +1,341 @@
+"""
+Steady-state solution of a thermal network by sparse LU factorisation.
+
+The network equations are ``G T = P`` where ``G`` holds the conductances
+(symmetric) plus the upwind coolant transport terms (not symmetric), so a
+general sparse direct factorisation is used rather than Cholesky.
+"""
+from collections import OrderedDict
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import splu
+
+from cooling.thermal.cache import LRUCache, geometry_fingerprint
+from cooling.thermal.exceptions import ThermalModelError
+from cooling.thermal.multigrid import IterativeSolver, lu_nbytes, sparse_nbytes
+from cooling.thermal.network import COMPONENT_GROUPS, build_network
+from cooling.thermal.validation import model_entries
+
+# The matrix is structurally symmetric, so order on A + A^T; COLAMD fills in
+# badly around the slice nodes that every winding node of a slice touches.
+PERMUTATION = 'MMD_AT_PLUS_A'
+
+# Bytes of factorised models kept per worker.  A 2,000-node model takes
+# about 2 MB, one just below ITERATIVE_SIZE about 50 MB and a 360,000-node
+# multigrid hierarchy a few hundred MB.
+FACTORIZATION_BYTES = 1024 * 1024 * 1024
+FACTORIZATIONS = LRUCache(maxsize=FACTORIZATION_BYTES)
+
+# Above this many nodes the LU factors get too big for a worker and the
+# multigrid-preconditioned iterative solver is used; ``mesh.solver`` can
+# force "direct" or "iterative".
+ITERATIVE_SIZE = 20000
+SOLVERS = ('auto', 'direct', 'iterative')
+
+
+def assemble(network, conductances=None):
+    """
+    Conductance matrix in CSR form and the ambient part of the right-hand
+    side per kelvin of ambient temperature.  ``conductances`` replaces the
+    values of ``network.link_arrays()`` when given.
+    """
+    size = len(network)
+    i, j, g = network.link_arrays()
+    if conductances is not None:
+        g = conductances
+    boundary, boundary_g = network.ambient_arrays()
+    upstream, downstream, capacity = network.flow_arrays()
+    internal = upstream >= 0
+
+    rows = np.concatenate([i, j, i, j, boundary, downstream, downstream[internal]])
+    cols = np.concatenate([j, i, i, j, boundary, downstream, upstream[internal]])
+    data = np.concatenate([-g, -g, g, g, boundary_g, capacity, -capacity[internal]])
+    matrix = coo_matrix((data, (rows, cols)), shape=(size, size)).tocsr()
+
+    ambient = np.zeros(size)
+    np.add.at(ambient, boundary, boundary_g)
+    np.add.at(ambient, downstream[~internal], capacity[~internal])
+    return matrix, ambient
+
+
+def check_grounded(network):
+    """
+    Raise ThermalModelError unless every connected part of the network
+    reaches ambient through a face or a coolant inflow; the conductance
+    matrix of a floating part is singular.
+    """
+    size = len(network)
+    i, j, _ = network.link_arrays()
+    boundary, _ = network.ambient_arrays()
+    upstream, downstream, _ = network.flow_arrays()
+    internal = upstream >= 0
+    rows = np.concatenate([i, downstream[internal]])
+    cols = np.concatenate([j, upstream[internal]])
+    graph = coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(size, size))
+    _, labels = connected_components(graph, directed=False)
+    grounded = np.zeros(labels.max() + 1 if size else 0, dtype=bool)
+    grounded[labels[boundary]] = True
+    grounded[labels[downstream[~internal]]] = True
+    floating = np.flatnonzero(~grounded[labels])
+    if len(floating):
+        raise ThermalModelError('Node "%s" has no path to ambient; add a face to ambient or a coolant passage'
+                                % network.names[floating[0]])
+
+
+def factorise(matrix, network, iterative):
+    """
+    LU factors of ``matrix``, or a multigrid-preconditioned ``IterativeSolver``
+    on the winding grids of ``network`` when ``iterative``.  Both have ``solve``.
+    """
+    if iterative:
+        return IterativeSolver(matrix.tocsr(), [grid.indices for grid in network.grids])
+    return splu(matrix.tocsc(), permc_spec=PERMUTATION)
+
+
+class SteadyState(object):
+    """
+    LU factors of a network's conductance matrix.  Losses only enter the
+    right-hand side, so any set of losses is a forward/back substitution.
+    Very large networks get an ``IterativeSolver`` in place of the factors;
+    ``iterative`` tells the transient and nonlinear solvers to do the same.
+    """
+
+    def __init__(self, network, solver='auto'):
+        if solver not in SOLVERS:
+            raise ThermalModelError('Unknown solver "%s"' % solver)
+        check_grounded(network)
+        self.network = network
+        self.matrix, self.ambient = assemble(network)
+        self.iterative = solver == 'iterative' or (solver == 'auto' and len(network) > ITERATIVE_SIZE)
+        self.factor = factorise(self.matrix, network, self.iterative)
+
+    @property
+    def nbytes(self):
+        """
+        Approximate memory of the matrix and its factors or hierarchy.
+        """
+        factor = self.factor.nbytes if isinstance(self.factor, IterativeSolver) else lu_nbytes(self.factor)
+        return sparse_nbytes(self.matrix) + self.ambient.nbytes + factor
+
+    def solve(self, losses, ambient_temperature=None):
+        if ambient_temperature is None:
+            ambient_temperature = self.network.geometry.ambient_temperature
+        return self.factor.solve(self.network.loss_vector(losses) + self.ambient * ambient_temperature)
+
+    def solve_many(self, cases, ambient_temperature=None):
+        """
+        Temperatures for several sets of losses at once, one column per case.
+        """
+        if ambient_temperature is None:
+            ambient_temperature = self.network.geometry.ambient_temperature
+        heat = np.column_stack([self.network.loss_vector(losses) for losses in cases])
+        return self.factor.solve(heat + self.ambient[:, None] * ambient_temperature)
+
+
+def steady_state(model):
+    """
+    Factorised network for ``model``, shared by all models with the same geometry.
+    """
+    key = geometry_fingerprint(model)
+    state = FACTORIZATIONS.get(key)
+    if state is None:
+        state = SteadyState(build_network(model), (model.get('mesh') or {}).get('solver', 'auto'))
+        FACTORIZATIONS.put(key, state, size=state.nbytes)
+    return state
+
+
+def _components(network):
+    """
+    (name, node indices, normalised volume weights) of each reported component.
+    """
+    volumes = np.asarray(network.volumes)
+    for component, groups in COMPONENT_GROUPS:
+        nodes = np.asarray([index for group in groups for index in network.groups.get(group, [])], dtype=np.int64)
+        if not len(nodes):
+            continue
+        weights = volumes[nodes]
+        if weights.sum() <= 0:
+            weights = np.ones(len(nodes))
+        yield component, nodes, weights / weights.sum()
+
+
+def component_temperatures(network, temperatures):
+    result = []
+    for component, nodes, weights in _components(network):
+        values = temperatures[nodes]
+        result.append({
+            'AvgTemperature': float(weights.dot(values)),
+            'MaxTemperature': float(values.max()),
+            'Name': component,
+        })
+    return result
+
+
+def winding_temperatures(network, temperatures):
+    result = []
+    for grid in network.grids:
+        n_a, n_r, n_t = grid.shape
+        nodes = []
+        for a in range(n_a):
+            for r in range(n_r):
+                for t in range(n_t):
+                    nodes.append({
+                        'AxialCoordinate': float(grid.axial_coordinates[a]),
+                        'Name': '%s_%d_%d_%d' % (grid.name, a, r, t),
+                        'RadialLocation': r,
+                        'TangentialLocation': t,
+                        'Temperature': float(temperatures[grid.indices[a, r, t]]),
+                    })
+        result.append(nodes)
+    return result
+
+
+def coolant_temperatures(network, temperatures):
+    """
+    Inlet/outlet temperature and heat pick-up of every passage, in flow order.
+    """
+    if network.flow is None:
+        return []
+    i, j, g = network.link_arrays()
+    flux = g * (temperatures[j] - temperatures[i])
+    gained = np.bincount(i, flux, minlength=len(network)) - np.bincount(j, flux, minlength=len(network))
+    heat, capacities = {}, {}
+    for name, passage in network.passages.items():
+        heat[name] = float(gained[passage['nodes']].sum())
+        capacities[name] = passage['fluid'].density * passage['fluid'].specific_heat
+    inlets, outlets = network.flow.coolant_temperatures(heat, capacities, network.geometry.ambient_temperature)
+    return [{
+        'Name': name,
+        'FlowRate': network.flow.flow_rates[name],
+        'HeatPickup': heat[name],
+        'InletTemperature': inlets[name],
+        'OutletTemperature': outlets[name],
+        'TemperatureRise': outlets[name] - inlets[name],
+    } for name in network.flow.order]
+
+
+def winding_columns(network, temperatures):
+    """
+    One entry per winding grid with its shape, axial coordinates and the
+    temperatures flattened in (axial, radial, tangential) order, one such
+    row per column when ``temperatures`` holds several solutions.  The
+    temperatures stay an array; the renderers encode it directly.
+    """
+    return [{
+        'name': grid.name,
+        'shape': list(grid.shape),
+        'axial_coordinates': grid.axial_coordinates.tolist(),
+        'temperatures': temperatures[grid.indices.ravel()].T,
+    } for grid in network.grids]
+
+
+def with_substitutions(network, result):
+    """
+    Add the out-of-range parameters the geometry replaced by defaults to
+    ``result`` as ``substituted_parameters``, when there are any.
+    """
+    if network.geometry.substituted:
+        result['substituted_parameters'] = [dict(entry) for entry in network.geometry.substituted]
+    return result
+
+
+def model_results(network, temperatures, columnar=False):
+    """
+    Component, winding and coolant temperatures of one solution; the
+    windings as one dict per node, or per grid when ``columnar``.
+    """
+    result = {'component_temperatures': component_temperatures(network, temperatures)}
+    if columnar:
+        result['windings'] = winding_columns(network, temperatures)
+    else:
+        result['winding_temperatures'] = winding_temperatures(network, temperatures)
+    result['coolant_temperatures'] = coolant_temperatures(network, temperatures)
+    return with_substitutions(network, result)
+
+
+def solve_model(model, columnar=False):
+    """
+    Solve a posted cooling model and return the component and winding
+    temperatures in the shape the frontend consumes.
+    """
+    state = steady_state(model)
+    return model_results(state.network, state.solve(model.get('losses')), columnar)
+
+
+def _case_losses(model, case):
+    """
+    A load case is either a full ``losses`` list or one number per entry of
+    the model's own ``losses``.
+    """
+    base = model_entries(model.get('losses'), 'losses')
+    if not isinstance(case, list):
+        raise ThermalModelError('Each load case must be a list of losses')
+    if all(isinstance(value, (int, float)) for value in case):
+        if len(case) != len(base):
+            raise ThermalModelError('A load case needs %d loss values, got %d' % (len(base), len(case)))
+        return [dict(entry, loss=value) for entry, value in zip(base, case)]
+    return case
+
+
+def _with_speed(model, speed):
+    entries = model_entries(model.get('components'), 'components')
+    components = [component for component in entries if component.get('type') != 'Operation']
+    operation = next((component for component in entries
+                      if component.get('type') == 'Operation'), {'active': True, 'type': 'Operation'})
+    parameters = dict(operation.get('parameters') or {}, speed=speed)
+    return dict(model, components=components + [dict(operation, parameters=parameters)])
+
+
+def solve_batch(model, losses=None, speeds=None):
+    """
+    Solve one model for N load cases given as alternative ``losses`` and/or
+    ``Operation.speed`` values.  Cases sharing a speed share one factorisation
+    and are solved together as a multi-column right-hand side.
+    """
+    if losses is None and speeds is None:
+        raise ThermalModelError('Provide "losses" or "speeds" load cases')
+    for key, cases in (('losses', losses), ('speeds', speeds)):
+        if cases is not None and not isinstance(cases, list):
+            raise ThermalModelError('"%s" must be a list with one entry per load case' % key)
+    if speeds is not None and not all(isinstance(speed, (int, float)) and not isinstance(speed, bool)
+                                      and np.isfinite(speed) for speed in speeds):
+        raise ThermalModelError('"speeds" must be numbers')
+    if losses is not None and speeds is not None and len(losses) != len(speeds):
+        raise ThermalModelError('"losses" and "speeds" must have the same number of cases')
+    count = len(losses if losses is not None else speeds)
+    if not count:
+        raise ThermalModelError('At least one load case is required')
+    cases = [_case_losses(model, case) for case in losses] if losses is not None else [model.get('losses')] * count
+
+    by_speed = OrderedDict()
+    for index in range(count):
+        by_speed.setdefault(speeds[index] if speeds is not None else None, []).append(index)
+
+    network = None
+    temperatures = None
+    for speed, indices in by_speed.items():
+        state = steady_state(model if speed is None else _with_speed(model, speed))
+        if network is None:
+            network = state.network
+            temperatures = np.empty((len(network), count))
+        temperatures[:, indices] = state.solve_many([cases[index] for index in indices])
+
+    return dict(compact_results(network, temperatures), cases=count)
+
+
+def compact_results(network, temperatures):
+    """
+    Component averages/maxima and flat winding temperatures for several
+    solutions at once; ``temperatures`` has one column per solution.
+    """
+    components = list(_components(network))
+    return with_substitutions(network, {
+        'components': [component for component, _, _ in components],
+        'avg_temperatures': np.column_stack([weights.dot(temperatures[nodes])
+                                             for _, nodes, weights in components]).tolist(),
+        'max_temperatures': np.column_stack([temperatures[nodes].max(axis=0)
+                                             for _, nodes, _ in components]).tolist(),
+        'windings': winding_columns(network, temperatures),
+    })
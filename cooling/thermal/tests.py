@@ -0,0 +1,421 @@
+import copy
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from cooling.demo import demo_model
+from cooling.thermal import ThermalModelError, solve_batch, solve_model, solve_transient
+from cooling.thermal.correlations import FaceCoefficients, face_htc, nusselt
+from cooling.thermal.flow import FanCurve, FlowNetwork, solve_flow_split
+from cooling.thermal.fluids import PROPERTY_CACHE, PROPERTY_TABLES, Fluid
+from cooling.thermal.geometry import AMBIENT_TEMPERATURE
+from cooling.thermal.nonlinear import WARM_STARTS, solve_model_nonlinear, solve_nonlinear
+from cooling.thermal.multigrid import IterativeSolver
+from cooling.thermal.solver import FACTORIZATIONS, coolant_temperatures, steady_state
+
+
+class ThermalTestCase(SimpleTestCase):
+    """
+    Base for solver tests on a copy of the demo model.
+    """
+
+    def setUp(self):
+        self.model = copy.deepcopy(demo_model()[0])
+        FACTORIZATIONS.clear()
+
+    def with_losses(self, scale):
+        return dict(self.model, losses=[dict(entry, loss=entry['loss'] * scale) for entry in self.model['losses']])
+
+    def with_speed(self, speed):
+        operation = {'active': True, 'type': 'Operation', 'parameters': {'speed': speed}}
+        return dict(self.model, components=self.model['components'] + [operation])
+
+    def assertWindingsEqual(self, windings, temperatures, places=7):
+        for winding, expected in zip(windings, temperatures):
+            np.testing.assert_almost_equal(np.ravel(winding['temperatures']), np.ravel(expected), places)
+
+
+class SteadyStateTest(ThermalTestCase):
+
+    def test_demo_model(self):
+        result = solve_model(self.model)
+        self.assertEqual([component['Name'] for component in result['component_temperatures']],
+                         ['Stator', 'Housing', 'Rotor', 'Winding', 'Magnet'])
+        self.assertEqual([len(grid) for grid in result['winding_temperatures']], [1710, 220])
+        self.assertEqual(result['winding_temperatures'][0][0]['Name'], 'RotorWinding-Leading_Core_0_0_0')
+        self.assertTrue(result['coolant_temperatures'])
+
+    def test_columnar(self):
+        result = solve_model(self.model)
+        columnar = solve_model(self.model, columnar=True)
+        self.assertEqual([(winding['name'], winding['shape']) for winding in columnar['windings']],
+                         [('RotorWinding-Leading_Core', [10, 19, 9]), ('StatorWinding_Core', [10, 22, 1])])
+        self.assertWindingsEqual(columnar['windings'], [[node['Temperature'] for node in grid]
+                                                        for grid in result['winding_temperatures']])
+        self.assertEqual(columnar['windings'][1]['axial_coordinates'],
+                         sorted({node['AxialCoordinate'] for node in result['winding_temperatures'][1]}))
+
+    def test_missing_component(self):
+        self.model['components'] = [component for component in self.model['components']
+                                    if component['type'] != 'Rotor']
+        with self.assertRaisesMessage(ThermalModelError, 'An active Rotor component is required'):
+            solve_model(self.model)
+
+    def test_malformed_lists(self):
+        for key, value in (('losses', [1, 2]), ('faces', ['x']), ('components', 'abc'), ('mesh', 'abc')):
+            with self.subTest(key=key), self.assertRaises(ThermalModelError):
+                solve_model(dict(self.model, **{key: value}))
+
+    def test_substituted_parameters(self):
+        substituted = solve_model(self.model)['substituted_parameters']
+        airgap = next(entry for entry in substituted if entry['parameter'] == 'airgap')
+        self.assertEqual(airgap['value'], 1.225)
+        self.assertLess(airgap['used'], 0.01)
+        self.assertEqual(solve_batch(self.model, speeds=[500])['substituted_parameters'], substituted)
+
+        for component in self.model['components']:
+            for entry in substituted:
+                if entry['parameter'] in (component.get('parameters') or {}):
+                    component['parameters'][entry['parameter']] = entry['used']
+        self.assertNotIn('substituted_parameters', solve_model(self.model))
+
+    def test_mesh_size(self):
+        for mesh in ({'stator_radial': 1e9}, {'axial_slices': 1e9}, {'rotor_radial': 1000, 'rotor_tangential': 1000}):
+            with self.subTest(mesh=mesh), self.assertRaisesMessage(ThermalModelError, 'at most 1000000 are allowed'):
+                solve_model(dict(self.model, mesh=mesh))
+        with self.assertRaisesMessage(ThermalModelError, 'Parameter "axial_slices" must be a number'):
+            solve_model(dict(self.model, mesh={'axial_slices': 'inf'}))
+
+    def test_no_path_to_ambient(self):
+        for passages in ([], self.model['passages']):
+            with self.subTest(passages=len(passages)):
+                model = dict(self.model, faces=[], passages=passages)
+                with self.assertRaisesMessage(ThermalModelError, 'has no path to ambient'):
+                    solve_model(model)
+                self.assertFalse(len(FACTORIZATIONS))
+
+
+class FactorizationReuseTest(ThermalTestCase):
+
+    def test_losses_reuse_factorization(self):
+        state = steady_state(self.model)
+        before = solve_model(self.model)
+        after = solve_model(self.with_losses(2))
+        self.assertIs(steady_state(self.with_losses(2)), state)
+        self.assertEqual(len(FACTORIZATIONS), 1)
+        # the network is linear in its losses
+        for single, double in zip(before['component_temperatures'], after['component_temperatures']):
+            self.assertAlmostEqual(double['AvgTemperature'] - AMBIENT_TEMPERATURE,
+                                   2 * (single['AvgTemperature'] - AMBIENT_TEMPERATURE), places=6)
+
+    def test_geometry_change_refactorises(self):
+        state = steady_state(self.model)
+        self.model['mesh'] = {'axial_slices': 12}
+        self.assertIsNot(steady_state(self.model), state)
+        self.assertEqual(len(FACTORIZATIONS), 2)
+
+
+class BatchTest(ThermalTestCase):
+
+    def test_losses(self):
+        scales = [0.5, 1.0, 2.0]
+        base = [entry['loss'] for entry in self.model['losses']]
+        batch = solve_batch(self.model, losses=[[loss * scale for loss in base] for scale in scales])
+        self.assertEqual(batch['cases'], 3)
+        for case, scale in enumerate(scales):
+            self.assertCaseEqual(batch, case, solve_model(self.with_losses(scale), columnar=True))
+
+    def test_speeds(self):
+        speeds = [500, 1500]
+        batch = solve_batch(self.model, speeds=speeds)
+        for case, speed in enumerate(speeds):
+            self.assertCaseEqual(batch, case, solve_model(self.with_speed(speed), columnar=True))
+
+    def test_invalid_cases(self):
+        for losses, speeds in ((5, None), (None, 5), (None, [{'speed': 1}]), ([[1, 2]], None), ([], None),
+                               ([[1] * 10], [500, 1500])):
+            with self.subTest(losses=losses, speeds=speeds), self.assertRaises(ThermalModelError):
+                solve_batch(self.model, losses=losses, speeds=speeds)
+
+    def assertCaseEqual(self, batch, case, single):
+        np.testing.assert_almost_equal(batch['avg_temperatures'][case],
+                                       [component['AvgTemperature'] for component in single['component_temperatures']])
+        self.assertWindingsEqual([{'temperatures': winding['temperatures'][case]} for winding in batch['windings']],
+                                 [winding['temperatures'] for winding in single['windings']])
+
+
+class TransientTest(ThermalTestCase):
+
+    def test_converges_to_steady_state(self):
+        steady = solve_model(self.model, columnar=True)
+        result = solve_transient(self.model, {'duration': 2e6, 'output_times': [0, 2e6]})
+        self.assertEqual(result['times'], [0, 2e6])
+        np.testing.assert_almost_equal(result['avg_temperatures'][-1],
+                                       [component['AvgTemperature'] for component in steady['component_temperatures']])
+        self.assertWindingsEqual([{'temperatures': winding['temperatures'][-1]} for winding in result['windings']],
+                                 [winding['temperatures'] for winding in steady['windings']])
+        np.testing.assert_allclose(result['avg_temperatures'][0], AMBIENT_TEMPERATURE)
+
+    def test_methods_agree(self):
+        options = {'duration': 3600, 'output_interval': 600}
+        euler = solve_transient(self.model, dict(options, method='backward_euler'))
+        crank_nicolson = solve_transient(self.model, dict(options, method='crank_nicolson'))
+        self.assertEqual(len(euler['times']), 7)
+        np.testing.assert_allclose(crank_nicolson['avg_temperatures'], euler['avg_temperatures'], atol=0.5)
+        # heating up from ambient
+        self.assertTrue(np.all(np.diff(np.asarray(euler['avg_temperatures']), axis=0) > 0))
+
+    def test_profile(self):
+        off = solve_transient(self.model, {'profile': [{'duration': 600, 'scale': 0}], 'duration': 1200})
+        np.testing.assert_allclose(off['avg_temperatures'], AMBIENT_TEMPERATURE)
+
+    def test_invalid_options(self):
+        for options in ({'method': 'x'}, {'duration': -1}, {'duration': 10, 'output_times': 'abc'},
+                        {'duration': 10, 'output_times': 5}, {'profile': [5]},
+                        {'profile': [{'duration': 1, 'scale': 'x'}]}):
+            with self.subTest(options=options), self.assertRaises(ThermalModelError):
+                solve_transient(self.model, options)
+
+    def test_output_interval(self):
+        result = solve_transient(self.model, {'duration': 10, 'output_interval': 2.5})
+        self.assertEqual(result['times'], [0.0, 2.5, 5.0, 7.5, 10.0])
+        for interval in (1e-9, 1e-320):
+            with self.subTest(interval=interval), self.assertRaisesMessage(ThermalModelError, 'At most'):
+                solve_transient(self.model, {'duration': 10, 'output_interval': interval})
+
+
+class NonlinearTest(ThermalTestCase):
+
+    def setUp(self):
+        super(NonlinearTest, self).setUp()
+        WARM_STARTS.clear()
+
+    def test_converges(self):
+        linear = solve_model(self.model)
+        result = solve_model_nonlinear(self.model)
+        self.assertGreater(result['iterations'], 1)
+        # copper losses grow with temperature, so every component runs hotter
+        for nonlinear, component in zip(result['component_temperatures'], linear['component_temperatures']):
+            self.assertGreater(nonlinear['AvgTemperature'], component['AvgTemperature'])
+
+    def test_warm_start(self):
+        temperatures, _ = solve_nonlinear(self.model)
+        self.assertEqual(len(WARM_STARTS), 1)
+        again, iterations = solve_nonlinear(self.model)
+        self.assertEqual(iterations, 1)
+        np.testing.assert_allclose(again, temperatures, atol=0.01)
+
+    def test_not_converged(self):
+        with self.assertRaisesMessage(ThermalModelError, 'did not converge in 1 iterations'):
+            solve_nonlinear(self.model, {'max_iterations': 1})
+
+    def test_invalid_options(self):
+        for options in ({'max_iterations': 'nan'}, {'max_iterations': 2.5}, {'max_iterations': 0},
+                        {'tolerance': 'x'}, {'relaxation': float('inf')}):
+            with self.subTest(options=options), self.assertRaises(ThermalModelError):
+                solve_nonlinear(self.model, options)
+
+
+class FlowNetworkTest(ThermalTestCase):
+
+    def passage(self, name):
+        return next(entry for entry in self.model['passages'] if entry['passage'] == name)
+
+    def test_order(self):
+        flow = FlowNetwork(self.model['passages'])
+        for name in flow.order:
+            for upstream in flow.upstream[name]:
+                self.assertLess(flow.order.index(upstream), flow.order.index(name))
+        self.assertIn((['OH_StatorFluid_EW-NDE-Stator'], ['OH_RotorFluid_EW-NDE-Rotor', 'BarrelGap_Core']),
+                      list(flow.junctions()))
+        flow.check_conservation()
+
+    def test_coolant_sweep(self):
+        state = steady_state(self.model)
+        temperatures = state.solve(self.model['losses'])
+        coolant = coolant_temperatures(state.network, temperatures)
+        self.assertEqual([entry['Name'] for entry in coolant], FlowNetwork(self.model['passages']).order)
+        for entry in coolant:
+            outlet = temperatures[state.network.passages[entry['Name']]['nodes'][-1]]
+            self.assertAlmostEqual(entry['OutletTemperature'], outlet, places=6)
+            self.assertAlmostEqual(entry['TemperatureRise'], entry['OutletTemperature'] - entry['InletTemperature'])
+        self.assertEqual(coolant[0]['InletTemperature'], AMBIENT_TEMPERATURE)
+
+    def test_unbalanced_junction(self):
+        self.passage('BarrelGap_Core')['flow_rate'] = 2.5
+        with self.assertRaisesMessage(ThermalModelError, 'Flow is not conserved'):
+            solve_model(self.model)
+
+    def test_closed_loop(self):
+        self.passage('OH_RotorFluid_EW-DE-Rotor')['out_passage'] = 'OH_StatorFluid_EW-NDE-Stator'
+        self.passage('OH_StatorFluid_EW-NDE-Stator')['in_passage'] = 'OH_RotorFluid_EW-DE-Rotor'
+        with self.assertRaisesMessage(ThermalModelError, 'form a closed loop'):
+            FlowNetwork(self.model['passages'])
+
+    def test_unknown_passage(self):
+        self.passage('BarrelGap_Core')['out_passage'] = 'Nowhere'
+        with self.assertRaisesMessage(ThermalModelError, 'Unknown passage "Nowhere"'):
+            FlowNetwork(self.model['passages'])
+
+
+class FlowSplitTest(ThermalTestCase):
+    """
+    A fan feeding A, which splits into B and C, and E, which merges with C
+    into F.
+    """
+
+    def setUp(self):
+        super(FlowSplitTest, self).setUp()
+        self.flow = FlowNetwork([
+            {'passage': 'A', 'out_passage': 'B,C'},
+            {'passage': 'B', 'in_passage': 'A'},
+            {'passage': 'C', 'in_passage': 'A', 'out_passage': 'F'},
+            {'passage': 'E', 'out_passage': 'F'},
+            {'passage': 'F', 'in_passage': 'C,E'},
+        ])
+        self.resistances = {'A': (0.0, 10.0), 'B': (0.0, 100.0), 'C': (0.0, 1000.0), 'E': (0.0, 100.0),
+                            'F': (0.0, 100.0)}
+        self.fan = {'curve': [[0, 1000], [10, 0]], 'rated_speed': 1000}
+
+    def split(self, speed=1000):
+        return solve_flow_split(self.flow, self.resistances, FanCurve(self.fan, speed))
+
+    def test_split(self):
+        rates = self.split()
+        self.assertAlmostEqual(rates['A'], rates['B'] + rates['C'])
+        self.assertAlmostEqual(rates['F'], rates['C'] + rates['E'])
+        # the fan lifts as much as the path through E and F drops
+        lift, _ = FanCurve(self.fan, 1000).pressure(rates['A'] + rates['E'])
+        self.assertAlmostEqual(lift, 100.0 * rates['E'] ** 2 + 100.0 * rates['F'] ** 2, places=4)
+
+    def test_affinity_laws(self):
+        rates = self.split()
+        # purely quadratic passages: flow scales with speed
+        for name, rate in self.split(speed=2000).items():
+            self.assertAlmostEqual(rate, 2 * rates[name])
+        curve = FanCurve(self.fan, 500)
+        self.assertEqual(curve.flows.tolist(), [0, 5])
+        self.assertEqual(curve.pressures.tolist(), [250, 0])
+
+    def test_reverse_flow(self):
+        self.resistances['A'] = (0.0, 1e4)
+        with self.assertRaisesMessage(ThermalModelError, 'backwards through passage "C"'):
+            self.split()
+
+    def test_model_fan(self):
+        self.model['components'].append({'type': 'Operation', 'parameters': {'speed': 1500}})
+        self.model['fan'] = {'curve': [[0, 2000], [10, 0]], 'rated_speed': 1500}
+        flow = steady_state(self.model).network.flow
+        entered = {entry['passage']: entry['flow_rate'] for entry in self.model['passages']}
+        self.assertNotEqual(flow.flow_rates, entered)
+        flow.check_conservation(tolerance=1e-6)
+
+    def test_invalid_curve(self):
+        for fan in ({'curve': 'x'}, {'curve': [[0, 1]]}, {'curve': [[0, 1], [1, 2]]},
+                    {'curve': [[0, 1], [1, 0]], 'rated_speed': -1}, 5):
+            with self.subTest(fan=fan), self.assertRaises(ThermalModelError):
+                FanCurve(fan, 1000)
+
+
+class FaceCoefficientsTest(ThermalTestCase):
+
+    def test_matches_face_htc(self):
+        network = steady_state(self.model).network
+        coefficients = FaceCoefficients(network.geometry, network.convection)
+        film = np.linspace(20.0, 150.0, len(coefficients.links))
+        h = coefficients.htc(film)
+        start = 0
+        for convection in network.convection:
+            rows = slice(start, start + len(convection.area))
+            start = rows.stop
+            passage = convection.passage
+            expected = face_htc(convection.calculation, network.geometry, passage['fluid'], passage['velocity'],
+                                passage['hydraulic_diameter'], swirl=convection.swirl, temperature=film[rows])
+            np.testing.assert_allclose(h[rows], np.broadcast_to(expected, h[rows].shape), rtol=1e-12)
+        self.assertEqual({convection.calculation for convection in network.convection}, {'CFD', 'EndRegion', 50})
+
+    def test_tables(self):
+        reynolds = np.array([1e4, 3.3e4, 1e6])
+        np.testing.assert_allclose(nusselt(reynolds, 0.7), 0.023 * reynolds ** 0.8 * 0.7 ** 0.4, rtol=1e-4)
+        self.assertEqual(nusselt(1000.0, 0.7), 7.54)
+
+    def test_unknown_calculation(self):
+        with self.assertRaisesMessage(ThermalModelError, 'Unknown face calculation "x"'):
+            face_htc('x', steady_state(self.model).network.geometry)
+
+
+class FluidTest(SimpleTestCase):
+
+    def setUp(self):
+        PROPERTY_CACHE.clear()
+
+    def test_table(self):
+        air = Fluid({'name': 'Air'})
+        table = PROPERTY_TABLES['Air']
+        self.assertEqual(air.conductivity, 0.02514)
+        np.testing.assert_allclose(air.properties(table['temperature']).viscosity, table['viscosity'])
+        self.assertAlmostEqual(float(air.properties(30.0).density), 0.5 * (1.204 + 1.127))
+        # held constant beyond the table
+        self.assertEqual(float(air.properties(500.0).conductivity), 0.03779)
+
+    def test_scaled_through_property_temperature(self):
+        air = Fluid({'name': 'Air', 'conductivity': 0.05})
+        self.assertAlmostEqual(air.conductivity, 0.05)
+        self.assertAlmostEqual(float(air.properties(100.0).conductivity), 0.03095 * 0.05 / 0.02514)
+        self.assertEqual(air.viscosity, Fluid({'name': 'Air'}).viscosity)
+
+    def test_own_table(self):
+        oil = Fluid({'name': 'Oil', 'properties': {'temperature': [0, 100], 'viscosity': [0.1, 0.01]}})
+        self.assertAlmostEqual(float(oil.properties(50.0).viscosity), 0.055)
+        self.assertAlmostEqual(oil.conductivity, 0.02514)
+
+    def test_cache(self):
+        water = Fluid({'name': 'Water'})
+        properties = water.properties(np.array([30.0, 40.0]))
+        self.assertIs(water.properties(np.array([30.001, 40.0])), properties)
+        self.assertIsNot(Fluid({'name': 'Water', 'density': 990.0}).properties(np.array([30.0, 40.0])), properties)
+        self.assertEqual(len(PROPERTY_CACHE), 2)
+        with self.assertRaises(ValueError):
+            properties.density[0] = 0.0
+
+    def test_invalid(self):
+        for entry in ({'name': 'Air', 'density': -1}, {'name': 'Air', 'density': 'x'},
+                      {'name': 'Oil', 'properties': {'temperature': [1, 0], 'density': [1, 1]}},
+                      {'name': 'Oil', 'properties': {'temperature': [0, 1], 'density': [1]}}):
+            with self.subTest(entry=entry), self.assertRaises(ThermalModelError):
+                Fluid(entry)
+
+
+class IterativeSolverTest(ThermalTestCase):
+
+    def with_solver(self, solver):
+        return dict(self.model, mesh={'solver': solver})
+
+    def test_matches_direct(self):
+        direct = solve_model(self.with_solver('direct'), columnar=True)
+        iterative = solve_model(self.with_solver('iterative'), columnar=True)
+        self.assertIsInstance(steady_state(self.with_solver('iterative')).factor, IterativeSolver)
+        self.assertWindingsEqual(iterative['windings'], [winding['temperatures'] for winding in direct['windings']],
+                                 places=3)
+
+    def test_transient_and_nonlinear(self):
+        options = {'duration': 1e5, 'output_times': [1e3, 1e5]}
+        direct = solve_transient(self.with_solver('direct'), options)
+        iterative = solve_transient(self.with_solver('iterative'), options)
+        np.testing.assert_allclose(iterative['avg_temperatures'], direct['avg_temperatures'], atol=1e-3)
+
+        WARM_STARTS.clear()
+        direct = solve_model_nonlinear(self.with_solver('direct'), columnar=True)
+        iterative = solve_model_nonlinear(self.with_solver('iterative'), columnar=True)
+        self.assertWindingsEqual(iterative['windings'], [winding['temperatures'] for winding in direct['windings']],
+                                 places=2)
+
+    def test_cache_counts_bytes(self):
+        direct = steady_state(self.with_solver('direct'))
+        iterative = steady_state(self.with_solver('iterative'))
+        self.assertEqual(FACTORIZATIONS.size, direct.nbytes + iterative.nbytes)
+        self.assertGreater(direct.nbytes, direct.matrix.data.nbytes)
+
+    def test_unknown_solver(self):
+        with self.assertRaisesMessage(ThermalModelError, 'Unknown solver "x"'):
+            steady_state(self.with_solver('x'))
@@ -0,0 +1,200 @@
+"""
+Time-domain solution of a thermal network for load cycles.
+
+Each step solves ``(C/dt + theta G) T1 = (C/dt - (1 - theta) G) T0 + P + A Ta``
+with ``theta = 1`` (backward Euler) or ``0.5`` (Crank-Nicolson).  Step sizes
+are restricted to ``initial_step * 2**k`` so the step matrix is factorised
+once per size and reused whenever the controller returns to it.  Losses are
+averaged over each step, so load changes need not fall on step boundaries,
+and results are interpolated to the requested output times instead of being
+kept for every step.
+"""
+import numpy as np
+from scipy.sparse import diags
+
+from cooling.thermal.exceptions import ThermalModelError
+from cooling.thermal.solver import _case_losses, compact_results, factorise, steady_state
+
+METHODS = {'backward_euler': 1.0, 'crank_nicolson': 0.5}
+
+TOLERANCE = 0.1
+INITIAL_STEP = 1.0
+SMALLEST_STEP = 2 ** -10
+MAX_STEPS = 100000
+MAX_OUTPUTS = 2000
+DEFAULT_OUTPUTS = 100
+
+
+def _number(options, key, default):
+    value = options.get(key, default)
+    if value is None:
+        raise ThermalModelError('Transient option "%s" is required' % key)
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        value = np.nan
+    if not np.isfinite(value):
+        raise ThermalModelError('Transient option "%s" must be a number' % key)
+    return value
+
+
+def _positive(options, key, default):
+    value = _number(options, key, default)
+    if value <= 0:
+        raise ThermalModelError('Transient option "%s" must be positive' % key)
+    return value
+
+
+class LoadProfile(object):
+    """
+    Piecewise-constant losses repeated with period ``sum(segment durations)``.
+    Each segment scales the model losses or gives its own ``losses`` list.
+    """
+
+    def __init__(self, network, model, segments):
+        if not isinstance(segments, list) or not segments:
+            raise ThermalModelError('Transient "profile" must be a non-empty list of segments')
+        durations = []
+        columns = []
+        base = network.loss_vector(model.get('losses'))
+        for segment in segments:
+            if not isinstance(segment, dict):
+                raise ThermalModelError('Every segment of the transient "profile" must be an object')
+            durations.append(_positive(segment, 'duration', None))
+            if segment.get('losses') is not None:
+                columns.append(network.loss_vector(_case_losses(model, segment['losses'])))
+            else:
+                columns.append(base * _number(segment, 'scale', 1.0))
+        self.heat = np.column_stack(columns)
+        self.ends = np.cumsum(durations)
+        self.period = self.ends[-1]
+
+    def average(self, start, stop):
+        """
+        Mean heat input per node over ``[start, stop]``.
+        """
+        weights = np.zeros(len(self.ends))
+        time = start
+        while time < stop:
+            cycle = np.floor(time / self.period) * self.period
+            segment = min(np.searchsorted(self.ends, time - cycle, side='right'), len(self.ends) - 1)
+            end = min(cycle + self.ends[segment], stop)
+            if end <= time:
+                end = min(cycle + self.period, stop)
+            weights[segment] += end - time
+            time = end
+        return self.heat.dot(weights) / (stop - start)
+
+
+class TransientSolver(object):
+    """
+    Step matrices of one network, factorised lazily per step size with the
+    solver the steady state chose for the network.
+    """
+
+    def __init__(self, state, theta):
+        self.state = state
+        self.theta = theta
+        capacity = np.asarray(state.network.capacities)
+        # keep the step matrix regular for nodes without any modelled mass
+        self.capacity = np.maximum(capacity, 1e-9 * max(capacity.max(), 1.0))
+        self.factors = {}
+
+    def factor(self, step):
+        factor = self.factors.get(step)
+        if factor is None:
+            matrix = diags(self.capacity / step) + self.theta * self.state.matrix
+            factor = factorise(matrix, self.state.network, self.state.iterative)
+            self.factors[step] = factor
+        return factor
+
+    def step(self, temperatures, step, heat):
+        rhs = self.capacity / step * temperatures + heat
+        if self.theta < 1.0:
+            rhs -= (1.0 - self.theta) * self.state.matrix.dot(temperatures)
+        return self.factor(step).solve(rhs)
+
+
+def solve_transient(model, options):
+    """
+    Integrate the model over a load cycle and return snapshots at the
+    requested output times in the compact (columnar) result layout.
+    """
+    if not isinstance(options, dict):
+        raise ThermalModelError('"transient" must be an object')
+    method = options.get('method', 'backward_euler')
+    if method not in METHODS:
+        raise ThermalModelError('Unknown transient method "%s"' % method)
+    state = steady_state(model)
+    network = state.network
+    ambient_temperature = network.geometry.ambient_temperature
+
+    segments = options.get('profile')
+    if segments is None:
+        segments = [{'duration': _positive(options, 'duration', None)}]
+    profile = LoadProfile(network, model, segments)
+    duration = _positive(options, 'duration', profile.period)
+    if options.get('output_times') is not None:
+        if not isinstance(options['output_times'], list):
+            raise ThermalModelError('Transient option "output_times" must be a list of times')
+        output_times = sorted(_number({'output_times': time}, 'output_times', None)
+                              for time in options['output_times'])
+        if output_times and (output_times[0] < 0 or output_times[-1] > duration):
+            raise ThermalModelError('Output times must lie between 0 and the duration')
+    else:
+        interval = _positive(options, 'output_interval', duration / DEFAULT_OUTPUTS)
+        # count before allocating; a tiny interval would ask for billions
+        count = np.floor(duration / interval + 0.5) + 1
+        if count > MAX_OUTPUTS:
+            raise ThermalModelError('At most %d output times are allowed' % MAX_OUTPUTS)
+        output_times = (interval * np.arange(int(count))).tolist()
+    if len(output_times) > MAX_OUTPUTS:
+        raise ThermalModelError('At most %d output times are allowed' % MAX_OUTPUTS)
+
+    tolerance = _positive(options, 'tolerance', TOLERANCE)
+    initial_step = _positive(options, 'initial_step', INITIAL_STEP)
+    max_step = _positive(options, 'max_step', duration / 10)
+    initial_step = min(initial_step, max_step)
+    smallest = max(int(np.floor(np.log2(SMALLEST_STEP / initial_step))), -40)
+    largest = max(int(np.floor(np.log2(max_step / initial_step))), 0)
+
+    solver = TransientSolver(state, METHODS[method])
+    ambient = state.ambient * ambient_temperature
+    temperatures = np.full(len(network), _number(options, 'initial_temperature', ambient_temperature))
+    snapshots = np.empty((len(network), len(output_times)))
+    pending = 0
+    while pending < len(output_times) and output_times[pending] <= 0:
+        snapshots[:, pending] = temperatures
+        pending += 1
+
+    time, level, steps, rejected, rate = 0.0, 0, 0, 0, None
+    while pending < len(output_times):
+        if steps >= MAX_STEPS:
+            raise ThermalModelError('Transient did not finish within %d steps' % MAX_STEPS)
+        step = initial_step * 2.0 ** level
+        updated = solver.step(temperatures, step, profile.average(time, time + step) + ambient)
+        new_rate = (updated - temperatures) / step
+        error = 0.0 if rate is None else 0.5 * step * np.abs(new_rate - rate).max()
+        if error > tolerance and level > smallest:
+            level -= 1
+            rejected += 1
+            continue
+
+        while pending < len(output_times) and output_times[pending] <= time + step:
+            fraction = (output_times[pending] - time) / step
+            snapshots[:, pending] = temperatures + fraction * (updated - temperatures)
+            pending += 1
+        if rate is not None and error < 0.25 * tolerance and level < largest:
+            level += 1
+        time += step
+        temperatures, rate = updated, new_rate
+        steps += 1
+
+    result = compact_results(network, snapshots)
+    result.update({
+        'times': list(output_times),
+        'steps': steps,
+        'rejected_steps': rejected,
+        'factorizations': len(solver.factors),
+    })
+    return result
@@ -0,0 +1,19 @@
+"""
+Checks shared by the modules that read the lists of a posted cooling model.
+"""
+from cooling.thermal.exceptions import ThermalModelError
+
+
+def model_entries(value, key):
+    """
+    The objects of the model list ``key``, skipping null entries.  Raises
+    ThermalModelError when it is not a list of objects.
+    """
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise ThermalModelError('"%s" must be a list' % key)
+    entries = [entry for entry in value if entry is not None]
+    if not all(isinstance(entry, dict) for entry in entries):
+        raise ThermalModelError('Every entry of "%s" must be an object' % key)
+    return entries
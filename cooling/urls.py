@@ -11,12 +11,22 @@ urlpatterns = [
     path('cooling/me',
          views.MyCoolingListView.as_view(),
          name='mycooling-list'),
+    path('cooling/export',
+         views.CoolingExportView.as_view(),
+         name='cooling-export'),
+    path('cooling/me/export',
+         views.MyCoolingExportView.as_view(),
+         name='mycooling-export'),
     path('cooling/me/<int:pk>',
          views.CoolingDetailView.as_view(),
          name='cooling-detail'),
     path('cooling/demo_model',
          views.get_demo_model,
          name='cooling-detail'),
+    path('cooling/demo_result',
+         views.get_demo_result),
     path('cooling/solve',
-         views.solve_thermal_model)
+         views.solve_thermal_model),
+    path('cooling/solve/batch',
+         views.solve_thermal_model_batch)
 ]